@@ -226,12 +226,14 @@ class AuditDashboardPanel(private val project: Project) : JPanel(BorderLayout())
                 ?.readBytes()?.let { "data:image/png;base64," + Base64.getEncoder().encodeToString(it) } ?: ""
         }.getOrDefault("")
 
-        val genEvents     = events.filter { it.eventType == AuditEventType.GENERATION }
-        val valEvents     = events.filter { it.eventType == AuditEventType.VALIDATION }
-        val explEvents    = events.filter { it.eventType == AuditEventType.EXPLAINABILITY }
-        val codeGenEvents = events.filter { it.eventType == AuditEventType.CODE_GENERATION }
-        val qualEvents    = events.filter { it.eventType == AuditEventType.QUALITY_SCAN }
-        val runtimeEvents = events.filter { it.eventType == AuditEventType.RUNTIME_ANALYSIS }
+        // One pass over the events instead of one filter per type
+        val byType        = events.groupBy { it.eventType }
+        val genEvents     = byType[AuditEventType.GENERATION].orEmpty()
+        val valEvents     = byType[AuditEventType.VALIDATION].orEmpty()
+        val explEvents    = byType[AuditEventType.EXPLAINABILITY].orEmpty()
+        val codeGenEvents = byType[AuditEventType.CODE_GENERATION].orEmpty()
+        val qualEvents    = byType[AuditEventType.QUALITY_SCAN].orEmpty()
+        val runtimeEvents = byType[AuditEventType.RUNTIME_ANALYSIS].orEmpty()
         fun successPct(list: List<AuditEvent>) =
             if (list.isEmpty()) "—" else "${list.count { it.success } * 100 / list.size}%"
 
@@ -15,8 +15,12 @@ import java.net.http.HttpResponse
  */
 class BedrockClient {
 
+    companion object {
+        // One client for all instances, so gateway calls reuse open connections
+        private val httpClient: HttpClient = HttpClient.newHttpClient()
+    }
+
     private val objectMapper = jacksonObjectMapper()
-    private val httpClient: HttpClient = HttpClient.newHttpClient()
 
     // Helper function to parse JSON context safely
     private fun parseContext(json: String): Map<String, Any> {
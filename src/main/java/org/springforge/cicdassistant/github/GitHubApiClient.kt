@@ -25,8 +25,13 @@ class GitHubApiClient(
             "GITHUB_PERSONAL_ACCESS_TOKEN not configured. Add it to your .env file."
         )
 ) {
+    companion object {
+        // GitHubMCPClient and the branch picker each create their own GitHubApiClient;
+        // one HttpClient keeps api.github.com connections alive across all of them
+        private val httpClient: HttpClient = HttpClient.newHttpClient()
+    }
+
     private val objectMapper = jacksonObjectMapper()
-    private val httpClient: HttpClient = HttpClient.newHttpClient()
 
     private fun apiBase(): String {
         val host = EnvironmentConfig.GitHub.host.trimEnd('/')
@@ -4,6 +4,7 @@ import kotlinx.coroutines.Dispatchers
 import kotlinx.coroutines.withContext
 import org.springforge.cicdassistant.mcp.models.*
 import java.time.Instant
+import java.util.concurrent.ConcurrentHashMap
 
 /**
  * Extracts Spring Boot project context from GitHub repositories using the GitHub REST API.
@@ -29,6 +30,12 @@ class GitHubMCPClient(
     // Current branch being analyzed (set by analyzeGitHubRepository)
     private var branch: String = "main"
 
+    // Files fetched during the current analysis, keyed by "owner/repo@branch:path".
+    // Build files are read by several steps, and probes for absent files repeat too,
+    // so hits and 404s are both remembered until the next analysis starts.
+    private val fetchedFiles = ConcurrentHashMap<String, String>()
+    private val missingFiles = ConcurrentHashMap.newKeySet<String>()
+
     /**
      * Analyze a GitHub repository and return MCP context
      *
@@ -44,6 +51,8 @@ class GitHubMCPClient(
     suspend fun analyzeGitHubRepository(repoUrl: String, branchName: String = "main"): MCPContext = withContext(Dispatchers.IO) {
         val (owner, repo) = parseGitHubUrl(repoUrl)
         this@GitHubMCPClient.branch = branchName // Store branch for use in file operations
+        fetchedFiles.clear()
+        missingFiles.clear()
 
         println("\n=== Analyzing GitHub Repository ===")
         println("Owner: $owner")
@@ -554,35 +563,7 @@ class GitHubMCPClient(
                         val content = getFileContents(owner, repo, filePath)
 
                         // Extract mapping annotations with method names
-                        val mappingPatterns = listOf(
-                            Regex("""@GetMapping\s*\(\s*["'](.+?)["']\s*\)[\s\S]*?(?:public|private|protected)?\s*\w+\s+(\w+)\s*\("""),
-                            Regex("""@PostMapping\s*\(\s*["'](.+?)["']\s*\)[\s\S]*?(?:public|private|protected)?\s*\w+\s+(\w+)\s*\("""),
-                            Regex("""@PutMapping\s*\(\s*["'](.+?)["']\s*\)[\s\S]*?(?:public|private|protected)?\s*\w+\s+(\w+)\s*\("""),
-                            Regex("""@DeleteMapping\s*\(\s*["'](.+?)["']\s*\)[\s\S]*?(?:public|private|protected)?\s*\w+\s+(\w+)\s*\("""),
-                            Regex("""@RequestMapping\s*\(\s*["'](.+?)["']\s*\)[\s\S]*?(?:public|private|protected)?\s*\w+\s+(\w+)\s*\(""")
-                        )
-
-                        mappingPatterns.forEach { pattern ->
-                            pattern.findAll(content).forEach { match ->
-                                val endpointPath = match.groupValues[1]
-                                val methodName = match.groupValues.getOrNull(2) ?: "unknown"
-                                val httpMethod = when {
-                                    pattern.pattern.contains("Get") -> "GET"
-                                    pattern.pattern.contains("Post") -> "POST"
-                                    pattern.pattern.contains("Put") -> "PUT"
-                                    pattern.pattern.contains("Delete") -> "DELETE"
-                                    else -> "ANY"
-                                }
-                                endpoints.add(
-                                    MCPCodeStructure.RestEndpoint(
-                                        httpMethod = httpMethod,
-                                        path = endpointPath,
-                                        controller = controller,
-                                        method = methodName
-                                    )
-                                )
-                            }
-                        }
+                        endpoints.addAll(parseRestEndpoints(content, controller))
 
                         break // Found the file, no need to try other paths
 
@@ -604,7 +585,17 @@ class GitHubMCPClient(
      * Get file contents from repository using the GitHub REST API
      */
     private fun getFileContents(owner: String, repo: String, path: String): String {
-        return apiClient.getFileContents(owner, repo, path, branch)
+        val key = "$owner/$repo@$branch:$path"
+        fetchedFiles[key]?.let { return it }
+        if (key in missingFiles) throw GitHubFileNotFoundException(path)
+
+        return try {
+            apiClient.getFileContents(owner, repo, path, branch).also { fetchedFiles[key] = it }
+        } catch (e: GitHubFileNotFoundException) {
+            // Only definite misses are remembered; rate limits and network errors are retried
+            missingFiles.add(key)
+            throw e
+        }
     }
 
     /**
@@ -653,4 +644,46 @@ class GitHubMCPClient(
             }
         }
     }
+
+    companion object {
+        /**
+         * One pattern per mapping annotation, each matching `@XMapping("path")` followed
+         * by the handler method name. They run as separate passes on purpose: a
+         * class-level @RequestMapping match spans the method annotations that follow it,
+         * and a combined pattern would swallow the first of them. The gap before the
+         * method signature is bounded so a mapping without a following method cannot
+         * drag the lazy scan across the rest of the file.
+         */
+        private val MAPPING_PATTERNS = listOf(
+            "GET" to mappingPattern("Get"),
+            "POST" to mappingPattern("Post"),
+            "PUT" to mappingPattern("Put"),
+            "DELETE" to mappingPattern("Delete"),
+            "ANY" to mappingPattern("Request")
+        )
+
+        private fun mappingPattern(kind: String) = Regex(
+            """@${kind}Mapping\s*\(\s*["'](.+?)["']\s*\)[\s\S]{0,2000}?(?:public|private|protected)?\s*\w+\s+(\w+)\s*\("""
+        )
+
+        /**
+         * Extract REST endpoints declared in a controller's source
+         */
+        internal fun parseRestEndpoints(content: String, controller: String): List<MCPCodeStructure.RestEndpoint> {
+            val endpoints = mutableListOf<MCPCodeStructure.RestEndpoint>()
+            for ((httpMethod, pattern) in MAPPING_PATTERNS) {
+                pattern.findAll(content).forEach { match ->
+                    endpoints.add(
+                        MCPCodeStructure.RestEndpoint(
+                            httpMethod = httpMethod,
+                            path = match.groupValues[1],
+                            controller = controller,
+                            method = match.groupValues.getOrNull(2) ?: "unknown"
+                        )
+                    )
+                }
+            }
+            return endpoints
+        }
+    }
 }
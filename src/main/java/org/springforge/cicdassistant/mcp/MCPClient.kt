@@ -43,25 +43,26 @@ class MCPClient {
         const val FILTERED_PLACEHOLDER = "***FILTERED***"
         
         /**
-         * Sensitive key patterns to detect in configuration properties
+         * Sensitive key patterns to detect in configuration properties,
+         * combined into one alternation so each key is scanned once
          */
-        private val SENSITIVE_KEY_PATTERNS = listOf(
-            Regex("password", RegexOption.IGNORE_CASE),
-            Regex("passwd", RegexOption.IGNORE_CASE),
-            Regex("pwd", RegexOption.IGNORE_CASE),
-            Regex("secret", RegexOption.IGNORE_CASE),
-            Regex("api[_-]?key", RegexOption.IGNORE_CASE),
-            Regex("access[_-]?key", RegexOption.IGNORE_CASE),
-            Regex("private[_-]?key", RegexOption.IGNORE_CASE),
-            Regex("token", RegexOption.IGNORE_CASE),
-            Regex("auth", RegexOption.IGNORE_CASE),
-            Regex("credentials?", RegexOption.IGNORE_CASE),
-            Regex("jwt", RegexOption.IGNORE_CASE),
-            Regex("bearer", RegexOption.IGNORE_CASE),
-            Regex("oauth", RegexOption.IGNORE_CASE),
-            Regex("aws[_-]?secret", RegexOption.IGNORE_CASE),
-            Regex("aws[_-]?access", RegexOption.IGNORE_CASE)
-        )
+        private val SENSITIVE_KEY_PATTERN = listOf(
+            "password",
+            "passwd",
+            "pwd",
+            "secret",
+            "api[_-]?key",
+            "access[_-]?key",
+            "private[_-]?key",
+            "token",
+            "auth",
+            "credentials?",
+            "jwt",
+            "bearer",
+            "oauth",
+            "aws[_-]?secret",
+            "aws[_-]?access"
+        ).joinToString("|").toRegex(RegexOption.IGNORE_CASE)
     }
 
     /**
@@ -356,8 +357,6 @@ class MCPClient {
      * @return true if the key is sensitive, false otherwise
      */
     private fun isSensitiveKey(key: String): Boolean {
-        return SENSITIVE_KEY_PATTERNS.any { pattern ->
-            pattern.containsMatchIn(key)
-        }
+        return SENSITIVE_KEY_PATTERN.containsMatchIn(key)
     }
 }
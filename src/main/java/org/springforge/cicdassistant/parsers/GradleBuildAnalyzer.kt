@@ -1,6 +1,7 @@
 package org.springforge.cicdassistant.parsers
 
 import java.io.File
+import java.util.concurrent.ConcurrentHashMap
 
 /**
  * AST-based analyzer for Gradle build files (build.gradle / build.gradle.kts)
@@ -8,6 +9,50 @@ import java.io.File
  */
 class GradleBuildAnalyzer {
 
+    companion object {
+        private val PLUGINS_BLOCK_START = Regex("""plugins\s*\{""")
+        private val DEPENDENCIES_BLOCK_START = Regex("""dependencies\s*\{""")
+
+        private val KTS_PLUGIN_PATTERN =
+            Regex("""id\s*\(\s*["']([^"']+)["']\s*\)(?:\s+version\s+["']([^"']+)["'])?""")
+        private val GROOVY_PLUGIN_PATTERN =
+            Regex("""id\s+['"]([^'"]+)['"](?:\s+version\s+['"]([^'"]+)['"])?""")
+        private val KTS_DEPENDENCY_PATTERN =
+            Regex("""(implementation|api|compileOnly|runtimeOnly|testImplementation)\s*\(\s*["']([^"']+)["']\s*\)""")
+        private val GROOVY_DEPENDENCY_PATTERN =
+            Regex("""(implementation|api|compileOnly|runtimeOnly|testImplementation)\s+['"]([^'"]+)['"]""")
+
+        private val JAVA_VERSION_ENUM_PATTERN = Regex("""sourceCompatibility\s*=\s*JavaVersion\.VERSION_(\d+)""")
+        private val SOURCE_COMPATIBILITY_PATTERN = Regex("""sourceCompatibility\s*=\s*['"]?(\d+)['"]?""")
+        private val JVM_TARGET_PATTERN = Regex("""jvmTarget\s*=\s*["'](\d+)["']""")
+        private val KOTLIN_PLUGIN_VERSION_PATTERN =
+            Regex("""kotlin\s*\(\s*["']jvm["']\s*\)\s+version\s+["']([^"']+)["']""")
+        private val SPRING_BOOT_VERSION_PATTERN =
+            Regex("""id\s*\(\s*["']org\.springframework\.boot["']\s*\)\s+version\s+["']([^"']+)["']""")
+        private val VERSION_SET_PATTERN = Regex("""version\.set\s*\(\s*["']([^"']+)["']\s*\)""")
+
+        /** Per plugin id: Kotlin DSL, Groovy DSL and `apply plugin:` forms in one pattern */
+        private val PLUGIN_DECLARATION_PATTERNS = ConcurrentHashMap<String, Regex>()
+
+        /**
+         * Body of the first `<name> { ... }` block, found by counting brace depth
+         * in a single pass so nested blocks stay inside the body; null if the block
+         * is absent or never closed
+         */
+        internal fun blockBody(content: String, blockStart: Regex): String? {
+            val start = blockStart.find(content) ?: return null
+            val bodyStart = start.range.last + 1
+            var depth = 1
+            for (i in bodyStart until content.length) {
+                when (content[i]) {
+                    '{' -> depth++
+                    '}' -> if (--depth == 0) return content.substring(bodyStart, i)
+                }
+            }
+            return null
+        }
+    }
+
     /**
      * Analyze Gradle build file and extract project metadata
      */
@@ -75,17 +120,12 @@ class GradleBuildAnalyzer {
      */
     private fun hasPlugin(content: String, pluginId: String): Boolean {
         // Kotlin DSL: id("org.jetbrains.intellij")
-        val kotlinDslPattern = Regex("""id\s*\(\s*["']$pluginId["']\s*\)""")
-        
         // Groovy DSL: id 'org.jetbrains.intellij'
-        val groovyDslPattern = Regex("""id\s+['"]$pluginId['"]""")
-        
         // Old style: apply plugin: 'org.jetbrains.intellij'
-        val applyPluginPattern = Regex("""apply\s+plugin\s*:\s*['"]$pluginId['"]""")
-
-        return kotlinDslPattern.containsMatchIn(content) ||
-               groovyDslPattern.containsMatchIn(content) ||
-               applyPluginPattern.containsMatchIn(content)
+        val pattern = PLUGIN_DECLARATION_PATTERNS.getOrPut(pluginId) {
+            Regex("""id\s*\(\s*["']$pluginId["']\s*\)|id\s+['"]$pluginId['"]|apply\s+plugin\s*:\s*['"]$pluginId['"]""")
+        }
+        return pattern.containsMatchIn(content)
     }
 
     /**
@@ -95,23 +135,11 @@ class GradleBuildAnalyzer {
         val plugins = mutableListOf<GradlePlugin>()
 
         // Extract from plugins {} block
-        val pluginsBlockRegex = if (isKotlinDsl) {
-            Regex("""plugins\s*\{([^}]+)\}""", RegexOption.DOT_MATCHES_ALL)
-        } else {
-            Regex("""plugins\s*\{([^}]+)\}""", RegexOption.DOT_MATCHES_ALL)
-        }
-
-        pluginsBlockRegex.find(content)?.let { match ->
-            val pluginsBlock = match.groupValues[1]
-
+        blockBody(content, PLUGINS_BLOCK_START)?.let { pluginsBlock ->
             // Extract plugin IDs and versions
-            val pluginPattern = if (isKotlinDsl) {
-                // Kotlin DSL: id("org.jetbrains.intellij") version "1.17.0"
-                Regex("""id\s*\(\s*["']([^"']+)["']\s*\)(?:\s+version\s+["']([^"']+)["'])?""")
-            } else {
-                // Groovy DSL: id 'org.jetbrains.intellij' version '1.17.0'
-                Regex("""id\s+['"]([^'"]+)['"](?:\s+version\s+['"]([^'"]+)['"])?""")
-            }
+            // Kotlin DSL: id("org.jetbrains.intellij") version "1.17.0"
+            // Groovy DSL: id 'org.jetbrains.intellij' version '1.17.0'
+            val pluginPattern = if (isKotlinDsl) KTS_PLUGIN_PATTERN else GROOVY_PLUGIN_PATTERN
 
             pluginPattern.findAll(pluginsBlock).forEach { pluginMatch ->
                 plugins.add(GradlePlugin(
@@ -131,19 +159,10 @@ class GradleBuildAnalyzer {
         val dependencies = mutableListOf<GradleDependency>()
 
         // Extract dependencies {} block
-        val dependenciesBlockRegex = Regex("""dependencies\s*\{([^}]+)\}""", RegexOption.DOT_MATCHES_ALL)
-        
-        dependenciesBlockRegex.find(content)?.let { match ->
-            val depsBlock = match.groupValues[1]
-
+        blockBody(content, DEPENDENCIES_BLOCK_START)?.let { depsBlock ->
             // Match dependency declarations
-            val depPattern = if (isKotlinDsl) {
-                // implementation("group:artifact:version")
-                Regex("""(implementation|api|compileOnly|runtimeOnly|testImplementation)\s*\(\s*["']([^"']+)["']\s*\)""")
-            } else {
-                // implementation 'group:artifact:version'
-                Regex("""(implementation|api|compileOnly|runtimeOnly|testImplementation)\s+['"]([^'"]+)['"]""")
-            }
+            // implementation("group:artifact:version") / implementation 'group:artifact:version'
+            val depPattern = if (isKotlinDsl) KTS_DEPENDENCY_PATTERN else GROOVY_DEPENDENCY_PATTERN
 
             depPattern.findAll(depsBlock).forEach { depMatch ->
                 val scope = depMatch.groupValues[1]
@@ -170,17 +189,17 @@ class GradleBuildAnalyzer {
      */
     private fun extractJavaVersion(content: String): String? {
         // Kotlin DSL: java { sourceCompatibility = JavaVersion.VERSION_21 }
-        Regex("""sourceCompatibility\s*=\s*JavaVersion\.VERSION_(\d+)""").find(content)?.let {
+        JAVA_VERSION_ENUM_PATTERN.find(content)?.let {
             return it.groupValues[1]
         }
 
         // Groovy DSL: sourceCompatibility = '21'
-        Regex("""sourceCompatibility\s*=\s*['"]?(\d+)['"]?""").find(content)?.let {
+        SOURCE_COMPATIBILITY_PATTERN.find(content)?.let {
             return it.groupValues[1]
         }
 
         // Kotlin options: kotlinOptions { jvmTarget = "21" }
-        Regex("""jvmTarget\s*=\s*["'](\d+)["']""").find(content)?.let {
+        JVM_TARGET_PATTERN.find(content)?.let {
             return it.groupValues[1]
         }
 
@@ -192,8 +211,7 @@ class GradleBuildAnalyzer {
      */
     private fun extractKotlinVersion(content: String): String? {
         // kotlin("jvm") version "1.9.23"
-        val kotlinPluginRegex = Regex("""kotlin\s*\(\s*["']jvm["']\s*\)\s+version\s+["']([^"']+)["']""")
-        return kotlinPluginRegex.find(content)?.groupValues?.get(1)
+        return KOTLIN_PLUGIN_VERSION_PATTERN.find(content)?.groupValues?.get(1)
     }
 
     /**
@@ -201,8 +219,7 @@ class GradleBuildAnalyzer {
      */
     private fun extractSpringBootVersion(content: String): String? {
         // id("org.springframework.boot") version "3.2.0"
-        val springBootRegex = Regex("""id\s*\(\s*["']org\.springframework\.boot["']\s*\)\s+version\s+["']([^"']+)["']""")
-        return springBootRegex.find(content)?.groupValues?.get(1)
+        return SPRING_BOOT_VERSION_PATTERN.find(content)?.groupValues?.get(1)
     }
 
     /**
@@ -210,8 +227,7 @@ class GradleBuildAnalyzer {
      */
     private fun extractIntellijPlatformVersion(content: String): String? {
         // intellij { version.set("IU-2024.3") }
-        val versionSetRegex = Regex("""version\.set\s*\(\s*["']([^"']+)["']\s*\)""")
-        return versionSetRegex.find(content)?.groupValues?.get(1)
+        return VERSION_SET_PATTERN.find(content)?.groupValues?.get(1)
     }
 }
 
@@ -14,8 +14,12 @@ import java.net.http.HttpResponse
  */
 class ClaudeService {
 
+    companion object {
+        // Shared so every instance reuses one connection pool (HTTP/2, keep-alive)
+        private val httpClient: HttpClient = HttpClient.newHttpClient()
+    }
+
     private val objectMapper = jacksonObjectMapper()
-    private val httpClient: HttpClient = HttpClient.newHttpClient()
     private val dockerfilePromptBuilder = DockerfilePromptBuilder()
 
     init {
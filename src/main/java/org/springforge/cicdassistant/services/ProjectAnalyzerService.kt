@@ -11,6 +11,12 @@ import org.springforge.cicdassistant.mcp.MCPClient
 import org.springforge.cicdassistant.mcp.models.MCPContext
 import org.w3c.dom.Element
 import java.io.File
+import java.io.IOException
+import java.nio.file.FileVisitResult
+import java.nio.file.Files
+import java.nio.file.Path
+import java.nio.file.SimpleFileVisitor
+import java.nio.file.attribute.BasicFileAttributes
 
 /**
  * Service to analyze Spring Boot project structure and extract metadata
@@ -220,9 +226,7 @@ class ProjectAnalyzerService {
      */
     private fun extractGradleDependencies(content: String): List<String> {
         val dependencies = mutableListOf<String>()
-        val dependencyPattern = Regex("""implementation\s*\(?\s*["']([^"']+)["']""")
-
-        dependencyPattern.findAll(content).forEach { match ->
+        GRADLE_IMPLEMENTATION_PATTERN.findAll(content).forEach { match ->
             val dep = match.groupValues[1]
             // Extract artifact ID (last part after :)
             val artifactId = dep.split(":").lastOrNull()
@@ -271,8 +275,7 @@ class ProjectAnalyzerService {
      * Extract Java version from Gradle build file
      */
     private fun extractJavaVersionFromGradle(content: String): String {
-        val javaVersionPattern = Regex("""jvmTarget\s*=\s*["'](\d+)["']""")
-        val match = javaVersionPattern.find(content)
+        val match = JVM_TARGET_PATTERN.find(content)
         return match?.groupValues?.get(1) ?: "17"
     }
 
@@ -280,8 +283,7 @@ class ProjectAnalyzerService {
      * Extract Spring Boot version from Gradle build file
      */
     private fun extractSpringBootVersionFromGradle(content: String): String {
-        val springBootPattern = Regex("""org\.springframework\.boot['"]\s+version\s+["']([^"']+)["']""")
-        val match = springBootPattern.find(content)
+        val match = SPRING_BOOT_VERSION_PATTERN.find(content)
         return match?.groupValues?.get(1) ?: "3.2.0"
     }
 
@@ -324,21 +326,23 @@ class ProjectAnalyzerService {
      * Find Spring Boot main class package
      */
     private fun findSpringBootMainClass(dir: File): String? {
-        dir.listFiles()?.forEach { file ->
-            if (file.isDirectory) {
-                val result = findSpringBootMainClass(file)
-                if (result != null) return result
-            } else if (file.extension == "java") {
-                val content = file.readText()
-                if (content.contains("@SpringBootApplication")) {
-                    // Extract package name from file
-                    val packagePattern = Regex("""package\s+([\w.]+)\s*;""")
-                    val match = packagePattern.find(content)
-                    return match?.groupValues?.get(1)
-                }
+        var packageName: String? = null
+        // Single depth-first walk; attributes come from the directory listing, and
+        // the walk stops at the first match
+        Files.walkFileTree(dir.toPath(), object : SimpleFileVisitor<Path>() {
+            override fun visitFile(file: Path, attrs: BasicFileAttributes): FileVisitResult {
+                if (!file.fileName.toString().endsWith(".java")) return FileVisitResult.CONTINUE
+                val content = file.toFile().readText()
+                if (!content.contains("@SpringBootApplication")) return FileVisitResult.CONTINUE
+                // Extract package name from file
+                packageName = PACKAGE_PATTERN.find(content)?.groupValues?.get(1)
+                return FileVisitResult.TERMINATE
             }
-        }
-        return null
+
+            override fun visitFileFailed(file: Path, exc: IOException): FileVisitResult =
+                FileVisitResult.CONTINUE
+        })
+        return packageName
     }
 
     /**
@@ -452,5 +456,11 @@ class ProjectAnalyzerService {
         val mcpContext = analyzeProjectWithMCP(project)
         return mcpClient.getContextSizeInfo(mcpContext)
     }
-}
 
+    companion object {
+        private val GRADLE_IMPLEMENTATION_PATTERN = Regex("""implementation\s*\(?\s*["']([^"']+)["']""")
+        private val JVM_TARGET_PATTERN = Regex("""jvmTarget\s*=\s*["'](\d+)["']""")
+        private val SPRING_BOOT_VERSION_PATTERN = Regex("""org\.springframework\.boot['"]\s+version\s+["']([^"']+)["']""")
+        private val PACKAGE_PATTERN = Regex("""package\s+([\w.]+)\s*;""")
+    }
+}
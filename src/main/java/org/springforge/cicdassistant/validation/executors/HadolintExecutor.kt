@@ -19,11 +19,25 @@ class HadolintExecutor {
     private val mapper = jacksonObjectMapper()
     private val hadolintCommand = "hadolint"
     
+    companion object {
+        /** How long a failed probe is trusted before hadolint is looked up again */
+        private const val UNAVAILABLE_RECHECK_MS = 60_000L
+
+        @Volatile private var available = false
+        @Volatile private var lastFailedProbeAt = 0L
+    }
+
     /**
-     * Checks if Hadolint is installed and available
+     * Checks if Hadolint is installed and available.
+     * The probe spawns a process, so a positive result is kept for the session and a
+     * negative one for [UNAVAILABLE_RECHECK_MS] (picking up a later install)
      */
     fun isAvailable(): Boolean {
-        return try {
+        if (available) return true
+        val now = System.currentTimeMillis()
+        if (lastFailedProbeAt != 0L && now - lastFailedProbeAt < UNAVAILABLE_RECHECK_MS) return false
+
+        val found = try {
             val process = ProcessBuilder(hadolintCommand, "--version")
                 .redirectErrorStream(true)
                 .start()
@@ -32,6 +46,8 @@ class HadolintExecutor {
         } catch (e: Exception) {
             false
         }
+        if (found) available = true else lastFailedProbeAt = now
+        return found
     }
     
     /**
@@ -140,7 +140,7 @@ class CreateNewProjectAction : AnAction("SpringForge: Create New Spring Boot Pro
         val srcMainJava = File(projectRoot, "src/main/java")
         if (!srcMainJava.exists()) return null
         val appFile = srcMainJava.walkTopDown()
-            .firstOrNull { it.isFile && it.name.endsWith("Application.java") }
+            .firstOrNull { it.name.endsWith("Application.java") && it.isFile }
             ?: return null
         val packageDir = appFile.parentFile ?: return null
         return packageDir.relativeTo(srcMainJava).path.replace(File.separatorChar, '.')
@@ -6,6 +6,7 @@ import com.github.javaparser.ast.body.FieldDeclaration
 import org.springforge.codegeneration.parser.EntitySpec
 import org.springforge.codegeneration.parser.FieldSpec
 import org.springforge.codegeneration.parser.RelationshipSpec
+import org.springforge.codegeneration.utils.SourceFileUtils
 import java.io.File
 
 /**
@@ -55,6 +56,9 @@ class ExistingEntityExtractor(private val projectBasePath: String) {
             "Set" to "Set",
             "Collection" to "Collection"
         )
+
+        /** Matches collection-typed relationship fields, e.g. `List<Order>` */
+        private val GENERIC_COLLECTION_REGEX = Regex("""(?:List|Set|Collection)<\s*(\w+)\s*>""")
     }
 
     /**
@@ -66,10 +70,11 @@ class ExistingEntityExtractor(private val projectBasePath: String) {
 
         // Find all Java files that contain @Entity annotation (quick pre-filter)
         val entityFiles = srcMainJava.walkTopDown()
-            .filter { it.isFile && it.name.endsWith(".java") }
+            .filter { it.name.endsWith(".java") && it.isFile }
             .filter { file ->
                 try {
-                    val text = file.readText()
+                    // Latin-1 over the whole file: the markers are ASCII, so no UTF-8 decode is needed
+                    val text = SourceFileUtils.readHead(file, Int.MAX_VALUE)
                     text.contains("@Entity") || text.contains("@javax.persistence.Entity") ||
                             text.contains("@jakarta.persistence.Entity")
                 } catch (_: Exception) {
@@ -252,7 +257,7 @@ class ExistingEntityExtractor(private val projectBasePath: String) {
      */
     private fun extractTargetEntity(rawType: String): String? {
         // Handle generic types like List<Order>, Set<Product>
-        val genericMatch = Regex("""(?:List|Set|Collection)<\s*(\w+)\s*>""").find(rawType)
+        val genericMatch = GENERIC_COLLECTION_REGEX.find(rawType)
         if (genericMatch != null) {
             return genericMatch.groupValues[1]
         }
@@ -277,13 +282,15 @@ class ExistingEntityExtractor(private val projectBasePath: String) {
      * Keeps generics intact but ensures readability.
      */
     private fun simplifyType(rawType: String): String {
+        // Most field types are already simple names — nothing to strip
+        if ('.' !in rawType) return rawType
         // Remove fully-qualified names, keeping only the simple name
         return rawType
-            .replace(Regex("""java\.util\."""), "")
-            .replace(Regex("""java\.lang\."""), "")
-            .replace(Regex("""java\.time\."""), "")
-            .replace(Regex("""java\.math\."""), "")
-            .replace(Regex("""jakarta\.persistence\."""), "")
-            .replace(Regex("""javax\.persistence\."""), "")
+            .replace("java.util.", "")
+            .replace("java.lang.", "")
+            .replace("java.time.", "")
+            .replace("java.math.", "")
+            .replace("jakarta.persistence.", "")
+            .replace("javax.persistence.", "")
     }
 }
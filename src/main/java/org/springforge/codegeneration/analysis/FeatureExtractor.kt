@@ -2,6 +2,7 @@ package org.springforge.codegeneration.analysis
 
 import com.intellij.openapi.application.ReadAction
 import com.intellij.openapi.project.Project
+import com.intellij.openapi.util.text.StringUtil
 import com.intellij.psi.*
 import com.intellij.psi.search.FileTypeIndex
 import com.intellij.psi.search.GlobalSearchScope
@@ -28,9 +29,10 @@ class FeatureExtractor(private val project: Project) {
     }
 
     private fun doExtract(): Map<String, Int> {
-        // initialize feature map
-        val features = mutableMapOf<String, Int>()
-        FEATURE_LIST.forEach { features[it] = 0 }
+        // fixed-index counters, one slot per FEATURE_LIST entry
+        val counts = IntArray(FEATURE_LIST.size)
+        // class simple name -> number of qualified calls resolved to it
+        val classRefCounts = HashMap<String, Int>()
 
         val psiManager = PsiManager.getInstance(project)
 
@@ -47,26 +49,27 @@ class FeatureExtractor(private val project: Project) {
 
         // first pass: collect per-file metrics and class->layer mapping, imports
         for (jf in javaFiles) {
-            features["total_java_files"] = features["total_java_files"]!! + 1
+            counts[F_TOTAL_JAVA_FILES] += 1
 
-            val text = jf.text
-            features["loc"] = features["loc"]!! + (text.lines().size)
+            // count newlines on the cached file contents instead of splitting a text copy
+            val lineCount = StringUtil.countNewLines(jf.viewProvider.contents) + 1
+            counts[F_LOC] += lineCount
             // approximate method count by counting method declarations
             val methodCount = PsiTreeUtil.findChildrenOfType(jf, PsiMethod::class.java).size
-            features["method_count"] = features["method_count"]!! + methodCount
+            counts[F_METHOD_COUNT] += methodCount
 
             // classes/interfaces
             val classes = jf.classes
-            features["class_count"] = features["class_count"]!! + classes.size
+            counts[F_CLASS_COUNT] += classes.size
             val interfaces = classes.count { it.isInterface }
-            features["interface_count"] = features["interface_count"]!! + interfaces
+            counts[F_INTERFACE_COUNT] += interfaces
 
             // detect file-name based hints
             val fname = jf.virtualFile?.name ?: ""
-            if (fname.contains("Controller", true)) features["file_named_controller"] = features["file_named_controller"]!! + 1
-            if (fname.contains("Service", true)) features["file_named_service"] = features["file_named_service"]!! + 1
-            if (fname.contains("Repository", true)) features["file_named_repository"] = features["file_named_repository"]!! + 1
-            if (DTO_REGEX.containsMatchIn(fname)) features["dto_like_names"] = features["dto_like_names"]!! + 1
+            if (fname.contains("Controller", true)) counts[F_FILE_NAMED_CONTROLLER] += 1
+            if (fname.contains("Service", true)) counts[F_FILE_NAMED_SERVICE] += 1
+            if (fname.contains("Repository", true)) counts[F_FILE_NAMED_REPOSITORY] += 1
+            if (DTO_REGEX.containsMatchIn(fname)) counts[F_DTO_LIKE_NAMES] += 1
 
             // imports
             val importList = jf.importList
@@ -75,58 +78,57 @@ class FeatureExtractor(private val project: Project) {
                 for (imp in imports) {
                     val impText = imp.importReference?.qualifiedName ?: ""
                     when {
-                        impText.startsWith("org.springframework.web") -> features["spring_web"] = features["spring_web"]!! + 1
-                        impText.startsWith("org.springframework.stereotype") -> features["spring_stereotype"] = features["spring_stereotype"]!! + 1
+                        impText.startsWith("org.springframework.web") -> counts[F_SPRING_WEB] += 1
+                        impText.startsWith("org.springframework.stereotype") -> counts[F_SPRING_STEREOTYPE] += 1
                         impText.startsWith("org.springframework.data") || impText.startsWith("org.springframework.data.jpa") ->
-                            features["spring_data"] = features["spring_data"]!! + 1
+                            counts[F_SPRING_DATA] += 1
                         impText.startsWith("javax.persistence") || impText.startsWith("jakarta.persistence") ->
-                            features["jpa"] = features["jpa"]!! + 1
+                            counts[F_JPA] += 1
                     }
                 }
             }
 
-            // package -> layer heuristics
-            val pkg = jf.packageName?.lowercase() ?: ""
+            // package -> layer heuristics (inferLayerFromPath ignores case, no lowercasing needed)
+            val pkg = jf.packageName ?: ""
             val inferredLayer = inferLayerFromPath(jf.virtualFile?.path ?: pkg)
-            if (inferredLayer != "unknown_layer") {
-                features[inferredLayer] = features[inferredLayer]!! + 1
-            } else {
-                features["unknown_layer"] = features["unknown_layer"]!! + 1
-            }
+            counts[FEATURE_INDEX.getValue(inferredLayer)] += 1
+            // Same for every class in the file, so resolved at most once
+            val packageLayer by lazy(LazyThreadSafetyMode.NONE) { inferLayerFromPath(pkg) }
 
             // classes: annotations and map class->layer
             for (cls in classes) {
                 val clsName = cls.name ?: continue
-                val clsLayer = inferLayerFromClass(cls, pkg)
+                // Resolve each annotation name once for both the layer and the counters
+                val annotationNames = cls.annotations.map { it.qualifiedName ?: it.text }
+                val clsLayer = inferLayerFromClass(annotationNames) ?: packageLayer
                 classLayerMap[clsName] = clsLayer
 
                 // annotations
-                for (ann in cls.annotations) {
-                    val qn = ann.qualifiedName ?: ann.text
+                for (qn in annotationNames) {
                     when {
                         qn.endsWith("RestController") || qn.endsWith("Controller") -> {
-                            features["controller"] = features["controller"]!! + 1
-                            features["controller_layer"] = features["controller_layer"]!! + 1
+                            counts[F_CONTROLLER] += 1
+                            counts[F_CONTROLLER_LAYER] += 1
                         }
                         qn.endsWith("Service") -> {
-                            features["service"] = features["service"]!! + 1
-                            features["service_layer"] = features["service_layer"]!! + 1
+                            counts[F_SERVICE] += 1
+                            counts[F_SERVICE_LAYER] += 1
                         }
                         qn.endsWith("Repository") -> {
-                            features["repository"] = features["repository"]!! + 1
-                            features["repository_layer"] = features["repository_layer"]!! + 1
+                            counts[F_REPOSITORY] += 1
+                            counts[F_REPOSITORY_LAYER] += 1
                         }
                         qn.endsWith("Entity") -> {
-                            features["entity"] = features["entity"]!! + 1
-                            features["is_entity"] = features["is_entity"]!! + 1
+                            counts[F_ENTITY] += 1
+                            counts[F_IS_ENTITY] += 1
                         }
-                        qn.endsWith("Configuration") -> features["config"] = features["config"]!! + 1
-                        qn.endsWith("Component") -> features["component"] = features["component"]!! + 1
+                        qn.endsWith("Configuration") -> counts[F_CONFIG] += 1
+                        qn.endsWith("Component") -> counts[F_COMPONENT] += 1
                     }
                 }
 
                 // detect DTO-like class names
-                if (DTO_REGEX.containsMatchIn(clsName)) features["dto_like_names"] = features["dto_like_names"]!! + 1
+                if (DTO_REGEX.containsMatchIn(clsName)) counts[F_DTO_LIKE_NAMES] += 1
             }
 
             // method bodies: detect service calls and inter-class references
@@ -135,7 +137,7 @@ class FeatureExtractor(private val project: Project) {
                 if (elem is PsiMethodCallExpression) {
                     val refText = elem.methodExpression.qualifierExpression?.text ?: ""
                     if (refText.endsWith("Service")) {
-                        features["service_call_count"] = features["service_call_count"]!! + 1
+                        counts[F_SERVICE_CALL_COUNT] += 1
                     }
 
                     // record target type simple name if available (for inter-layer edges)
@@ -146,10 +148,7 @@ class FeatureExtractor(private val project: Project) {
                             val targetName = resolved.name
                             if (targetName != null) {
                                 // increment class reference - we will evaluate edges in second pass
-                                // store temporary in features map using a reserved key (not persisted)
-                                val key = "__ref__${targetName}"
-                                features[key] = (features[key] ?: 0)
-                                features[key] = features[key]!! + 1
+                                classRefCounts.merge(targetName, 1, Int::plus)
                             }
                         }
                     }
@@ -158,60 +157,56 @@ class FeatureExtractor(private val project: Project) {
             }
         } // end first pass
 
-        // second pass: compute inter-layer edges using classLayerMap and temporary ref keys
-        for ((k, v) in features.toMap()) {
-            if (k.startsWith("__ref__")) {
-                val targetClass = k.removePrefix("__ref__")
-                val targetLayer = classLayerMap[targetClass] ?: "unknown_layer"
-                // We cannot know source layer here easily (would need origin mapping). As a conservative fallback,
-                // increment all possible edges from controllers/services/repositories present in this repo
-                // A more accurate approach: build class->source mapping from definitions and resolve references earlier.
-                // For now, estimate:
-                when (targetLayer) {
-                    "controller_layer" -> features["unknown_layer_to_controller_layer"] = features["unknown_layer_to_controller_layer"]!! + v
-                    "service_layer" -> features["unknown_layer_to_service_layer"] = features["unknown_layer_to_service_layer"]!! + v
-                    "repository_layer" -> features["unknown_layer_to_repository_layer"] = features["unknown_layer_to_repository_layer"]!! + v
-                    "domain_layer" -> features["unknown_layer_to_domain_layer"] = features["unknown_layer_to_domain_layer"]!! + v
-                    "usecase_layer" -> features["unknown_layer_to_usecase_layer"] = features["unknown_layer_to_usecase_layer"]!! + v
-                    else -> {}
-                }
-                // remove the temporary key
-                features.remove(k)
+        // second pass: compute inter-layer edges using classLayerMap and the recorded class references
+        for ((targetClass, v) in classRefCounts) {
+            val targetLayer = classLayerMap[targetClass] ?: "unknown_layer"
+            // We cannot know source layer here easily (would need origin mapping). As a conservative fallback,
+            // increment all possible edges from controllers/services/repositories present in this repo
+            // A more accurate approach: build class->source mapping from definitions and resolve references earlier.
+            // For now, estimate:
+            when (targetLayer) {
+                "controller_layer" -> counts[F_UNKNOWN_LAYER_TO_CONTROLLER_LAYER] += v
+                "service_layer" -> counts[F_UNKNOWN_LAYER_TO_SERVICE_LAYER] += v
+                "repository_layer" -> counts[F_UNKNOWN_LAYER_TO_REPOSITORY_LAYER] += v
+                "domain_layer" -> counts[F_UNKNOWN_LAYER_TO_DOMAIN_LAYER] += v
+                "usecase_layer" -> counts[F_UNKNOWN_LAYER_TO_USECASE_LAYER] += v
+                else -> {}
             }
         }
 
         // finalize unique_layers_used
         val usedLayers = classLayerMap.values.toSet().filter { it != "unknown_layer" }.size
-        features["unique_layers_used"] = usedLayers
+        counts[F_UNIQUE_LAYERS_USED] = usedLayers
 
+        // materialise the snapshot in canonical FEATURE_LIST order
+        val features = LinkedHashMap<String, Int>(FEATURE_LIST.size * 2)
+        FEATURE_LIST.forEachIndexed { i, name -> features[name] = counts[i] }
         return features
     }
 
     // infer a layer from file path using keywords
     private fun inferLayerFromPath(pathOrPkg: String): String {
-        val p = pathOrPkg.lowercase()
+        // Case-insensitive contains: same matches as lowercasing first, without the copy
+        fun has(s: String) = pathOrPkg.contains(s, ignoreCase = true)
         return when {
-            p.contains("/controller") || p.contains(".controller") || p.contains("/web/") -> "controller_layer"
-            p.contains("/service") || p.contains(".service") || p.contains("/application/") -> "service_layer"
-            p.contains("/repository") || p.contains(".repository") || p.contains("/infrastructure/") -> "repository_layer"
-            p.contains("/domain") || p.contains(".domain") || p.contains("/model/") -> "domain_layer"
-            p.contains("/usecase") || p.contains(".usecase") || p.contains("/interactor/") -> "usecase_layer"
+            has("/controller") || has(".controller") || has("/web/") -> "controller_layer"
+            has("/service") || has(".service") || has("/application/") -> "service_layer"
+            has("/repository") || has(".repository") || has("/infrastructure/") -> "repository_layer"
+            has("/domain") || has(".domain") || has("/model/") -> "domain_layer"
+            has("/usecase") || has(".usecase") || has("/interactor/") -> "usecase_layer"
             else -> "unknown_layer"
         }
     }
 
-    // infer layer from class annotations or package hints
-    private fun inferLayerFromClass(cls: PsiClass, pkgLower: String): String {
-        for (ann in cls.annotations) {
-            val qn = ann.qualifiedName ?: ann.text
+    // infer layer from class annotations; null means fall back to package hints
+    private fun inferLayerFromClass(annotationNames: List<String>): String? {
+        for (qn in annotationNames) {
             if (qn.endsWith("Controller") || qn.endsWith("RestController")) return "controller_layer"
             if (qn.endsWith("Service")) return "service_layer"
             if (qn.endsWith("Repository")) return "repository_layer"
             if (qn.endsWith("Entity")) return "domain_layer"
         }
-        // fallback to package keywords
-        val pkg = pkgLower.lowercase()
-        return inferLayerFromPath(pkg)
+        return null
     }
 
     companion object {
@@ -278,5 +273,41 @@ class FeatureExtractor(private val project: Project) {
             "usecase_layer_to_service_layer",
             "usecase_layer_to_unknown_layer"
         )
+
+        /** feature name -> slot in the per-extraction counter array */
+        private val FEATURE_INDEX: Map<String, Int> =
+            FEATURE_LIST.withIndex().associate { (i, name) -> name to i }
+
+        // slots of the features counted during extraction
+        private val F_CLASS_COUNT = FEATURE_INDEX.getValue("class_count")
+        private val F_COMPONENT = FEATURE_INDEX.getValue("component")
+        private val F_CONFIG = FEATURE_INDEX.getValue("config")
+        private val F_CONTROLLER = FEATURE_INDEX.getValue("controller")
+        private val F_CONTROLLER_LAYER = FEATURE_INDEX.getValue("controller_layer")
+        private val F_DTO_LIKE_NAMES = FEATURE_INDEX.getValue("dto_like_names")
+        private val F_ENTITY = FEATURE_INDEX.getValue("entity")
+        private val F_FILE_NAMED_CONTROLLER = FEATURE_INDEX.getValue("file_named_controller")
+        private val F_FILE_NAMED_REPOSITORY = FEATURE_INDEX.getValue("file_named_repository")
+        private val F_FILE_NAMED_SERVICE = FEATURE_INDEX.getValue("file_named_service")
+        private val F_INTERFACE_COUNT = FEATURE_INDEX.getValue("interface_count")
+        private val F_IS_ENTITY = FEATURE_INDEX.getValue("is_entity")
+        private val F_JPA = FEATURE_INDEX.getValue("jpa")
+        private val F_LOC = FEATURE_INDEX.getValue("loc")
+        private val F_METHOD_COUNT = FEATURE_INDEX.getValue("method_count")
+        private val F_REPOSITORY = FEATURE_INDEX.getValue("repository")
+        private val F_REPOSITORY_LAYER = FEATURE_INDEX.getValue("repository_layer")
+        private val F_SERVICE = FEATURE_INDEX.getValue("service")
+        private val F_SERVICE_CALL_COUNT = FEATURE_INDEX.getValue("service_call_count")
+        private val F_SERVICE_LAYER = FEATURE_INDEX.getValue("service_layer")
+        private val F_SPRING_DATA = FEATURE_INDEX.getValue("spring_data")
+        private val F_SPRING_STEREOTYPE = FEATURE_INDEX.getValue("spring_stereotype")
+        private val F_SPRING_WEB = FEATURE_INDEX.getValue("spring_web")
+        private val F_TOTAL_JAVA_FILES = FEATURE_INDEX.getValue("total_java_files")
+        private val F_UNIQUE_LAYERS_USED = FEATURE_INDEX.getValue("unique_layers_used")
+        private val F_UNKNOWN_LAYER_TO_CONTROLLER_LAYER = FEATURE_INDEX.getValue("unknown_layer_to_controller_layer")
+        private val F_UNKNOWN_LAYER_TO_DOMAIN_LAYER = FEATURE_INDEX.getValue("unknown_layer_to_domain_layer")
+        private val F_UNKNOWN_LAYER_TO_REPOSITORY_LAYER = FEATURE_INDEX.getValue("unknown_layer_to_repository_layer")
+        private val F_UNKNOWN_LAYER_TO_SERVICE_LAYER = FEATURE_INDEX.getValue("unknown_layer_to_service_layer")
+        private val F_UNKNOWN_LAYER_TO_USECASE_LAYER = FEATURE_INDEX.getValue("unknown_layer_to_usecase_layer")
     }
 }
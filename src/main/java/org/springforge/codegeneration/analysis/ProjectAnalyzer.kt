@@ -1,7 +1,11 @@
 package org.springforge.codegeneration.analysis
 
 import com.intellij.openapi.project.Project
+import org.springforge.codegeneration.utils.SourceFileUtils
 import java.io.File
+import java.security.MessageDigest
+import java.util.Base64
+import java.util.stream.Collectors
 
 class ProjectAnalyzer(private val project: Project) {
 
@@ -10,11 +14,12 @@ class ProjectAnalyzer(private val project: Project) {
         val srcMainJava = File(projectPath, "src/main/java")
         if (!srcMainJava.exists()) return ProjectAnalysisResult.empty()
 
+        // Only the file head is probed — the annotation precedes the class body
         val applicationFile = srcMainJava.walkTopDown()
             .firstOrNull {
-                it.isFile &&
-                        it.name.endsWith(".java") &&
-                        it.readText().contains("@SpringBootApplication")
+                it.name.endsWith(".java") &&
+                        it.isFile &&
+                        SourceFileUtils.readHead(it).contains("@SpringBootApplication")
             } ?: return ProjectAnalysisResult.empty()
 
         val basePackageDir = applicationFile.parentFile
@@ -29,30 +34,46 @@ class ProjectAnalyzer(private val project: Project) {
 
         val layers = layerDirs.map { it.name.lowercase() }
 
-        // ── Detect naming conventions ──
+        // ── Single walk of the base package: naming conventions + per-layer contents ──
+        val layerContents = layerDirs.associate { it.name to LayerContents() }
         val namingConventions = mutableMapOf<String, String>()
-        basePackageDir.walkTopDown()
-            .filter { it.isFile && it.name.endsWith(".java") }
-            .forEach { file ->
-                when {
-                    file.name.endsWith("Controller.java") ->
-                        namingConventions["controller"] = "Controller suffix"
-                    file.name.endsWith("ServiceImpl.java") ->
-                        namingConventions["service_impl"] = "ServiceImpl suffix"
-                    file.name.endsWith("DaoImpl.java") ->
-                        namingConventions["dao_impl"] = "DaoImpl suffix"
-                    file.name.endsWith("Repository.java") ->
-                        namingConventions["repository"] = "Repository suffix"
-                    file.name.endsWith("DTO.java") || file.name.endsWith("Dto.java") ->
-                        namingConventions["dto"] = "DTO suffix"
+        for (entry in basePackageDir.walkTopDown()) {
+            val relative = entry.relativeTo(basePackageDir).invariantSeparatorsPath
+            if (relative.isEmpty()) continue
+            val contents = layerContents[relative.substringBefore('/')]
+
+            if (entry.isDirectory) {
+                // Sub-folders at every depth, relative to their layer folder (pre-order)
+                if (contents != null && '/' in relative) {
+                    contents.subFolders.add(relative.substringAfter('/'))
                 }
+                continue
             }
+            // Name check first — it needs no file-system call, isFile does
+            if (!entry.name.endsWith(".java") || !entry.isFile) continue
+            contents?.javaFiles?.add(entry)
+
+            // ── Detect naming conventions ──
+            when {
+                entry.name.endsWith("Controller.java") ->
+                    namingConventions["controller"] = "Controller suffix"
+                entry.name.endsWith("ServiceImpl.java") ->
+                    namingConventions["service_impl"] = "ServiceImpl suffix"
+                entry.name.endsWith("DaoImpl.java") ->
+                    namingConventions["dao_impl"] = "DaoImpl suffix"
+                entry.name.endsWith("Repository.java") ->
+                    namingConventions["repository"] = "Repository suffix"
+                entry.name.endsWith("DTO.java") || entry.name.endsWith("Dto.java") ->
+                    namingConventions["dto"] = "DTO suffix"
+            }
+        }
 
         // ── Detect the ROLE of each layer folder by scanning its contents ──
-        // Also recursively collect ALL existing sub-folders
-        val detectedLayers = layerDirs.map { dir ->
-            detectLayerRole(dir, basePackage)
-        }
+        // Layer folders are independent, so they are scanned in parallel;
+        // the ordered collect keeps results in layerDirs order.
+        val detectedLayers: List<DetectedLayer> = layerDirs.parallelStream()
+            .map { dir -> detectLayerRole(dir, basePackage, layerContents.getValue(dir.name)) }
+            .collect(Collectors.toList())
 
         // ── Scan build file (pom.xml or build.gradle) ──
         val buildInfo = scanBuildFile(File(projectPath))
@@ -75,98 +96,84 @@ class ProjectAnalyzer(private val project: Project) {
     //  LAYER ROLE DETECTION
     // ═══════════════════════════════════════════════════════════
 
+    /** Sub-folders and Java files found under one layer folder during the base-package walk. */
+    private class LayerContents {
+        val subFolders = mutableListOf<String>()
+        val javaFiles = mutableListOf<File>()
+    }
+
     /**
      * Scan the Java files inside a layer folder and determine its role
      * based on annotations, class names, superclass patterns, and folder name.
-     * Recursively collects ALL existing sub-folders (not just immediate children).
+     * [contents] carries ALL existing sub-folders (not just immediate children)
+     * and the Java files, collected by the single walk in [analyze].
      */
-    private fun detectLayerRole(dir: File, basePackage: String): DetectedLayer {
+    private fun detectLayerRole(dir: File, basePackage: String, contents: LayerContents): DetectedLayer {
         val folderName = dir.name.lowercase()
         val fullPackage = "$basePackage.$folderName"
+        val subFolders = contents.subFolders
+        val javaFiles = contents.javaFiles
 
-        // Recursively collect ALL existing sub-folders at every depth
-        val subFolders = collectSubFolders(dir, "")
+        // Signal scores, indexed like SCORED_ROLES
+        val scores = IntArray(SCORED_ROLES.size)
 
-        // Scan all Java files recursively in this folder
-        val javaFiles = dir.walkTopDown()
-            .filter { it.isFile && it.name.endsWith(".java") }
-            .toList()
+        // ── Folder-name based heuristic (lower weight, acts as tiebreaker) ──
+        // Depends only on the folder name, so it is applied up front and the
+        // early-exit check below sees the complete non-file part of each score
+        when (folderName) {
+            "controller", "controllers", "api", "rest", "web", "endpoint", "endpoints" -> scores[R_CONTROLLER] += 1
+            "service", "services", "usecase", "usecases" -> scores[R_SERVICE] += 1
+            "repository", "repositories", "repo", "dao", "daos", "datasource", "persistence" -> scores[R_REPOSITORY] += 1
+            "entity", "entities", "domain", "model", "models" -> scores[R_ENTITY] += 1
+            "dto", "dtos", "request", "response", "payload" -> scores[R_DTO] += 1
+            "config", "configuration", "configs" -> scores[R_CONFIG] += 1
+            "exception", "exceptions", "error", "errors" -> scores[R_EXCEPTION] += 1
+        }
 
         // Count signals from file contents
-        var controllerSignals = 0
-        var serviceSignals = 0
-        var repositorySignals = 0
-        var entitySignals = 0
-        var dtoSignals = 0
-        var configSignals = 0
-        var exceptionSignals = 0
-
-        for (file in javaFiles) {
-            val content = try { file.readText() } catch (_: Exception) { continue }
+        for ((index, file) in javaFiles.withIndex()) {
+            // Anything past the first 200 KB is generated/vendored bulk; the role
+            // markers (annotations, supertypes) sit at the top of the file
+            val bytes = try {
+                SourceFileUtils.readHeadBytes(file, MAX_LAYER_SCAN_BYTES)
+            } catch (_: Exception) { continue }
             val fileName = file.name
+            val signals = contentSignalsFor(bytes)
 
             // ── Annotation-based detection ──
-            if (content.contains("@RestController") || content.contains("@Controller"))
-                controllerSignals += 3
-            if (content.contains("@Service"))
-                serviceSignals += 3
-            if (content.contains("@Repository") || content.contains("JpaRepository") ||
-                content.contains("CrudRepository") || content.contains("JpaSpecificationExecutor"))
-                repositorySignals += 3
-            if (content.contains("@Entity") || content.contains("@Table"))
-                entitySignals += 3
-            if (content.contains("@Configuration") || content.contains("@Bean"))
-                configSignals += 3
+            if (SIGNAL_CONTROLLER in signals) scores[R_CONTROLLER] += 3
+            if (SIGNAL_SERVICE in signals) scores[R_SERVICE] += 3
+            if (SIGNAL_REPOSITORY in signals) scores[R_REPOSITORY] += 3
+            if (SIGNAL_ENTITY in signals) scores[R_ENTITY] += 3
+            if (SIGNAL_CONFIG in signals) scores[R_CONFIG] += 3
 
             // ── Filename-based detection ──
-            if (fileName.endsWith("Controller.java")) controllerSignals += 2
-            if (fileName.endsWith("Service.java") || fileName.endsWith("ServiceImpl.java")) serviceSignals += 2
-            if (fileName.endsWith("Repository.java") || fileName.endsWith("Repo.java")) repositorySignals += 2
-            if (fileName.endsWith("Dao.java") || fileName.endsWith("DaoImpl.java")) repositorySignals += 2
+            if (fileName.endsWith("Controller.java")) scores[R_CONTROLLER] += 2
+            if (fileName.endsWith("Service.java") || fileName.endsWith("ServiceImpl.java")) scores[R_SERVICE] += 2
+            if (fileName.endsWith("Repository.java") || fileName.endsWith("Repo.java")) scores[R_REPOSITORY] += 2
+            if (fileName.endsWith("Dao.java") || fileName.endsWith("DaoImpl.java")) scores[R_REPOSITORY] += 2
             if (fileName.endsWith("DTO.java") || fileName.endsWith("Dto.java") ||
                 fileName.endsWith("Request.java") || fileName.endsWith("Response.java"))
-                dtoSignals += 2
-            if (fileName.contains("Exception") || fileName.contains("Error")) exceptionSignals += 2
+                scores[R_DTO] += 2
+            if (fileName.contains("Exception") || fileName.contains("Error")) scores[R_EXCEPTION] += 2
 
             // ── Content pattern detection ──
-            if (content.contains("@RequestMapping") || content.contains("@GetMapping") ||
-                content.contains("@PostMapping") || content.contains("@PutMapping") ||
-                content.contains("@DeleteMapping"))
-                controllerSignals += 2
-            if (content.contains("extends RuntimeException") || content.contains("extends Exception"))
-                exceptionSignals += 2
-        }
+            if (SIGNAL_MAPPING in signals) scores[R_CONTROLLER] += 2
+            if (SIGNAL_EXCEPTION in signals) scores[R_EXCEPTION] += 2
 
-        // ── Folder-name based heuristic (lower weight, acts as tiebreaker) ──
-        when (folderName) {
-            "controller", "controllers", "api", "rest", "web", "endpoint", "endpoints" -> controllerSignals += 1
-            "service", "services", "usecase", "usecases" -> serviceSignals += 1
-            "repository", "repositories", "repo", "dao", "daos", "datasource", "persistence" -> repositorySignals += 1
-            "entity", "entities", "domain", "model", "models" -> entitySignals += 1
-            "dto", "dtos", "request", "response", "payload" -> dtoSignals += 1
-            "config", "configuration", "configs" -> configSignals += 1
-            "exception", "exceptions", "error", "errors" -> exceptionSignals += 1
+            // Stop once the remaining files can no longer change the outcome
+            if (isRoleDecided(scores, remainingFiles = javaFiles.size - index - 1)) break
         }
 
-        // ── Pick the role with the highest signal score ──
-        val scores = mapOf(
-            LayerRole.CONTROLLER to controllerSignals,
-            LayerRole.SERVICE to serviceSignals,
-            LayerRole.REPOSITORY to repositorySignals,
-            LayerRole.ENTITY to entitySignals,
-            LayerRole.DTO to dtoSignals,
-            LayerRole.CONFIG to configSignals,
-            LayerRole.EXCEPTION to exceptionSignals
-        )
-
-        val bestRole = scores.maxByOrNull { it.value }
-        val role = if (bestRole != null && bestRole.value > 0) bestRole.key else LayerRole.UNKNOWN
+        // ── Pick the role with the highest signal score (first role wins ties) ──
+        val best = scores.indices.maxByOrNull { scores[it] }
+        val role = if (best != null && scores[best] > 0) SCORED_ROLES[best] else LayerRole.UNKNOWN
 
         // ── Special case: if entity and DTO signals are both high in same folder,
         //    it's a combined MODEL folder ──
-        val finalRole = if (role == LayerRole.ENTITY && dtoSignals > 0) {
+        val finalRole = if (role == LayerRole.ENTITY && scores[R_DTO] > 0) {
             LayerRole.MODEL
-        } else if (role == LayerRole.DTO && entitySignals > 0) {
+        } else if (role == LayerRole.DTO && scores[R_ENTITY] > 0) {
             LayerRole.MODEL
         } else {
             role
@@ -181,18 +188,51 @@ class ProjectAnalyzer(private val project: Project) {
     }
 
     /**
-     * Recursively collect all sub-folder paths relative to the given root dir.
-     * E.g., for a directory with structure: service/impl/cache → returns ["impl", "impl/cache"]
+     * True when scanning [remainingFiles] more files cannot change detectLayerRole's
+     * result: the current leader stays strictly ahead of every other role even if
+     * each remaining file maxes out that role, and the MODEL special case is settled.
      */
-    private fun collectSubFolders(dir: File, prefix: String): List<String> {
-        val result = mutableListOf<String>()
-        val children = dir.listFiles()?.filter { it.isDirectory } ?: return result
-        for (child in children) {
-            val relativePath = if (prefix.isEmpty()) child.name else "$prefix/${child.name}"
-            result.add(relativePath)
-            result.addAll(collectSubFolders(child, relativePath))
+    private fun isRoleDecided(scores: IntArray, remainingFiles: Int): Boolean {
+        val leader = scores.indices.maxByOrNull { scores[it] } ?: return false
+        if (scores[leader] == 0) return false
+        for (role in scores.indices) {
+            if (role != leader && scores[role] + remainingFiles * MAX_FILE_GAIN[role] >= scores[leader]) return false
         }
-        return result
+        // ENTITY/DTO leaders turn into MODEL once the other one shows up
+        if (leader == R_ENTITY && scores[R_DTO] == 0) return false
+        if (leader == R_DTO && scores[R_ENTITY] == 0) return false
+        return true
+    }
+
+    /**
+     * Content signals are a pure function of the file bytes, so identical files
+     * (copied DTOs, generated sources repeated across modules) are scanned once.
+     */
+    private fun contentSignalsFor(bytes: ByteArray): Set<String> {
+        val key = Base64.getEncoder().encodeToString(
+            MessageDigest.getInstance("SHA-256").digest(bytes)
+        )
+        synchronized(SIGNAL_CACHE) { SIGNAL_CACHE[key] }?.let { return it }
+
+        // Markers are pure ASCII, so ISO-8859-1 matches exactly what UTF-8 would
+        // while being a straight byte→char copy (no decoder, Latin-1 compact string)
+        val signals = scanContentSignals(String(bytes, Charsets.ISO_8859_1))
+        synchronized(SIGNAL_CACHE) { SIGNAL_CACHE[key] = signals }
+        return signals
+    }
+
+    /**
+     * Single pass over the file content: every marker is part of one alternation,
+     * so the text is scanned once instead of once per `contains` check.
+     * Returns the set of signal groups that were seen at least once.
+     */
+    private fun scanContentSignals(content: String): Set<String> {
+        val found = HashSet<String>()
+        for (match in CONTENT_SIGNAL_REGEX.findAll(content)) {
+            found.add(CONTENT_SIGNAL_MARKERS.getValue(match.value))
+            if (found.size == SIGNAL_GROUP_COUNT) break
+        }
+        return found
     }
 
     // ═══════════════════════════════════════════════════════════
@@ -236,22 +276,19 @@ class ProjectAnalyzer(private val project: Project) {
         val content = pomFile.readText()
         val dependencies = mutableListOf<BuildDependency>()
 
-        // Match <dependency> blocks
-        val depBlockRegex = Regex(
-            "<dependency>\\s*(.*?)\\s*</dependency>",
-            RegexOption.DOT_MATCHES_ALL
-        )
-        val groupRegex = Regex("<groupId>\\s*(.+?)\\s*</groupId>")
-        val artifactRegex = Regex("<artifactId>\\s*(.+?)\\s*</artifactId>")
-        val versionRegex = Regex("<version>\\s*(.+?)\\s*</version>")
-        val scopeRegex = Regex("<scope>\\s*(.+?)\\s*</scope>")
-
-        for (match in depBlockRegex.findAll(content)) {
-            val block = match.groupValues[1]
-            val groupId = groupRegex.find(block)?.groupValues?.get(1) ?: continue
-            val artifactId = artifactRegex.find(block)?.groupValues?.get(1) ?: continue
-            val version = versionRegex.find(block)?.groupValues?.get(1)
-            val scope = scopeRegex.find(block)?.groupValues?.get(1)
+        // Walk <dependency> blocks with indexOf — no DOTALL scan over the whole pom
+        var from = 0
+        while (true) {
+            val open = content.indexOf(DEP_OPEN, from)
+            if (open < 0) break
+            val close = content.indexOf(DEP_CLOSE, open + DEP_OPEN.length)
+            if (close < 0) break
+            from = close + DEP_CLOSE.length
+            val block = content.substring(open + DEP_OPEN.length, close)
+            val groupId = GROUP_REGEX.find(block)?.groupValues?.get(1) ?: continue
+            val artifactId = ARTIFACT_REGEX.find(block)?.groupValues?.get(1) ?: continue
+            val version = VERSION_REGEX.find(block)?.groupValues?.get(1)
+            val scope = SCOPE_REGEX.find(block)?.groupValues?.get(1)
 
             dependencies.add(BuildDependency(groupId, artifactId, version, scope))
         }
@@ -269,11 +306,7 @@ class ProjectAnalyzer(private val project: Project) {
 
         // Match patterns like: implementation 'group:artifact:version'
         // or implementation("group:artifact:version")
-        val depRegex = Regex(
-            """(?:implementation|api|compile|runtimeOnly|compileOnly|testImplementation)\s*[\('"]+([^:'"]+):([^:'"]+)(?::([^'")\s]+))?['")\s]"""
-        )
-
-        for (match in depRegex.findAll(content)) {
+        for (match in GRADLE_DEP_REGEX.findAll(content)) {
             dependencies.add(
                 BuildDependency(
                     groupId = match.groupValues[1],
@@ -285,4 +318,78 @@ class ProjectAnalyzer(private val project: Project) {
 
         return BuildInfo("gradle", dependencies, content, fileName)
     }
+
+    companion object {
+        // ── Role score slots used by detectLayerRole (order = tie-break order) ──
+        private val SCORED_ROLES = listOf(
+            LayerRole.CONTROLLER, LayerRole.SERVICE, LayerRole.REPOSITORY, LayerRole.ENTITY,
+            LayerRole.DTO, LayerRole.CONFIG, LayerRole.EXCEPTION
+        )
+        private const val R_CONTROLLER = 0
+        private const val R_SERVICE = 1
+        private const val R_REPOSITORY = 2
+        private const val R_ENTITY = 3
+        private const val R_DTO = 4
+        private const val R_CONFIG = 5
+        private const val R_EXCEPTION = 6
+
+        /** Upper bound of what a single file can add to each role's score */
+        private val MAX_FILE_GAIN = intArrayOf(7, 5, 7, 3, 2, 3, 4)
+
+        // ── Content signal groups used by detectLayerRole ──
+        private const val SIGNAL_CONTROLLER = "controller"
+        private const val SIGNAL_SERVICE = "service"
+        private const val SIGNAL_REPOSITORY = "repository"
+        private const val SIGNAL_ENTITY = "entity"
+        private const val SIGNAL_CONFIG = "config"
+        private const val SIGNAL_MAPPING = "mapping"
+        private const val SIGNAL_EXCEPTION = "exception"
+
+        /** Literal marker → signal group. No marker can start inside another one,
+         *  so a plain (non-overlapping) alternation scan sees every marker present. */
+        private val CONTENT_SIGNAL_MARKERS = linkedMapOf(
+            "@RestController" to SIGNAL_CONTROLLER,
+            "@Controller" to SIGNAL_CONTROLLER,
+            "@Service" to SIGNAL_SERVICE,
+            "@Repository" to SIGNAL_REPOSITORY,
+            "JpaRepository" to SIGNAL_REPOSITORY,
+            "CrudRepository" to SIGNAL_REPOSITORY,
+            "JpaSpecificationExecutor" to SIGNAL_REPOSITORY,
+            "@Entity" to SIGNAL_ENTITY,
+            "@Table" to SIGNAL_ENTITY,
+            "@Configuration" to SIGNAL_CONFIG,
+            "@Bean" to SIGNAL_CONFIG,
+            "@RequestMapping" to SIGNAL_MAPPING,
+            "@GetMapping" to SIGNAL_MAPPING,
+            "@PostMapping" to SIGNAL_MAPPING,
+            "@PutMapping" to SIGNAL_MAPPING,
+            "@DeleteMapping" to SIGNAL_MAPPING,
+            "extends RuntimeException" to SIGNAL_EXCEPTION,
+            "extends Exception" to SIGNAL_EXCEPTION
+        )
+        private val SIGNAL_GROUP_COUNT = CONTENT_SIGNAL_MARKERS.values.toSet().size
+        private val CONTENT_SIGNAL_REGEX = Regex(
+            CONTENT_SIGNAL_MARKERS.keys.joinToString("|") { Regex.escape(it) }
+        )
+
+        private const val MAX_LAYER_SCAN_BYTES = 200_000
+
+        /** LRU cache: SHA-256 of file bytes → content signal groups */
+        private const val SIGNAL_CACHE_SIZE = 8192
+        private val SIGNAL_CACHE = object : LinkedHashMap<String, Set<String>>(256, 0.75f, true) {
+            override fun removeEldestEntry(eldest: MutableMap.MutableEntry<String, Set<String>>?): Boolean =
+                size > SIGNAL_CACHE_SIZE
+        }
+
+        // Compiled once per class load instead of on every build-file parse
+        private const val DEP_OPEN = "<dependency>"
+        private const val DEP_CLOSE = "</dependency>"
+        private val GROUP_REGEX = Regex("<groupId>\\s*(.+?)\\s*</groupId>")
+        private val ARTIFACT_REGEX = Regex("<artifactId>\\s*(.+?)\\s*</artifactId>")
+        private val VERSION_REGEX = Regex("<version>\\s*(.+?)\\s*</version>")
+        private val SCOPE_REGEX = Regex("<scope>\\s*(.+?)\\s*</scope>")
+        private val GRADLE_DEP_REGEX = Regex(
+            """(?:implementation|api|compile|runtimeOnly|compileOnly|testImplementation)\s*[\('"]+([^:'"]+):([^:'"]+)(?::([^'")\s]+))?['")\s]"""
+        )
+    }
 }
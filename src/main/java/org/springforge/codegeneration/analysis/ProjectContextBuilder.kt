@@ -18,7 +18,7 @@ object ProjectContextBuilder {
         val predictor = ArchitecturePredictor()
         val prediction = predictor.predict(features)
 
-        // 4. FIX: Apply the same Heuristics as ExistingProjectAction
+        // 4. FIX: Apply the same Heuristics as ExistingProjectAction (which calls this one)
         // If we don't do this, the popup might say "MVC" (corrected)
         // while this prompt says "Layered" (raw model output).
         val finalArchitecture = if (prediction != null) {
@@ -36,10 +36,10 @@ object ProjectContextBuilder {
     }
 
     /**
-     * Shared heuristic logic to correct low-confidence predictions..
-     * Kept identical to ExistingProjectAction to ensure consistency.
+     * Shared heuristic logic to correct low-confidence predictions.
+     * ExistingProjectAction uses this same function, so the popup and the prompt agree.
      */
-    private fun applyHeuristics(
+    fun applyHeuristics(
         predicted: String,
         confidence: Double,
         f: Map<String, Int>
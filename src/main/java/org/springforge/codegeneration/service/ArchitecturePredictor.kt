@@ -13,10 +13,13 @@ class ArchitecturePredictor(
 
     private val mapper = jacksonObjectMapper()
 
-    private val client = OkHttpClient.Builder()
-        .connectTimeout(5, TimeUnit.SECONDS)
-        .readTimeout(15, TimeUnit.SECONDS)
-        .build()
+    companion object {
+        // Shared so every predictor reuses one connection pool (keep-alive) and dispatcher
+        private val client = OkHttpClient.Builder()
+            .connectTimeout(5, TimeUnit.SECONDS)
+            .readTimeout(15, TimeUnit.SECONDS)
+            .build()
+    }
 
     fun predict(features: Map<String, Int>): ArchitectureResult? {
         try {
@@ -18,6 +18,8 @@ object CodeFileParser {
 
     private val FILE_START = Regex("""===FILE:\s*(.+?)\s*===""")
     private const val FILE_END = "===END_FILE==="
+    private val LEADING_FENCE = Regex("""^```[\w]*\n""", RegexOption.MULTILINE)
+    private val TRAILING_FENCE = Regex("""\n```\s*$""", RegexOption.MULTILINE)
 
     /**
      * Parse raw LLM response text into structured file objects.
@@ -40,8 +42,8 @@ object CodeFileParser {
 
         // Strip any leading/trailing markdown code fences the LLM might add
         val cleaned = text
-            .replace(Regex("""^```[\w]*\n""", RegexOption.MULTILINE), "")
-            .replace(Regex("""\n```\s*$""", RegexOption.MULTILINE), "")
+            .replace(LEADING_FENCE, "")
+            .replace(TRAILING_FENCE, "")
 
         var remaining = cleaned
         while (true) {
@@ -7,7 +7,11 @@ import okhttp3.Request
 import okhttp3.RequestBody
 
 class InferenceClient(private val serverUrl: String = "http://127.0.0.1:8000") {
-    private val client = OkHttpClient()
+    companion object {
+        // OkHttp clients are meant to be shared: one pool and dispatcher for all instances
+        private val client = OkHttpClient()
+    }
+
     private val mapper = jacksonObjectMapper()
 
     fun predictArchitecture(payload: Any): String? {
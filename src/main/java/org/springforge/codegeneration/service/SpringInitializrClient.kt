@@ -15,7 +15,10 @@ import java.io.File
 class SpringInitializrClient(
     private val baseUrl: String = "https://start.spring.io"
 ) {
-    private val client = OkHttpClient()
+    companion object {
+        // Shared across instances so repeated downloads reuse the start.spring.io connection
+        private val client = OkHttpClient()
+    }
 
     /**
      * Request a starter zip with given parameters and download to given target file.
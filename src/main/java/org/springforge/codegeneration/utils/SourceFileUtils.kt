@@ -0,0 +1,33 @@
+package org.springforge.codegeneration.utils
+
+import java.io.File
+
+object SourceFileUtils {
+    /** Annotations and the class header sit near the top of a Java file. */
+    const val HEAD_PROBE_BYTES = 50_000
+
+    /**
+     * Read at most [maxBytes] from the start of [file] and decode them as ISO-8859-1.
+     * Every byte maps to exactly one char, so ASCII markers (annotations, keywords)
+     * match as usual without running the full UTF-8 decoder over the file.
+     */
+    fun readHead(file: File, maxBytes: Int = HEAD_PROBE_BYTES): String =
+        String(readHeadBytes(file, maxBytes), Charsets.ISO_8859_1)
+
+    /**
+     * Read at most [maxBytes] from the start of [file]. The buffer is sized from the
+     * file length, so small files don't pay for a [maxBytes]-sized allocation.
+     */
+    fun readHeadBytes(file: File, maxBytes: Int): ByteArray {
+        file.inputStream().use { input ->
+            val buffer = ByteArray(minOf(file.length(), maxBytes.toLong()).toInt())
+            var total = 0
+            while (total < buffer.size) {
+                val read = input.read(buffer, total, buffer.size - total)
+                if (read < 0) break
+                total += read
+            }
+            return if (total == buffer.size) buffer else buffer.copyOf(total)
+        }
+    }
+}
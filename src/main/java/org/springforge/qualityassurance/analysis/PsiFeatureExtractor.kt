@@ -1,7 +1,10 @@
 package org.springforge.qualityassurance.analysis
 
+import com.intellij.concurrency.JobLauncher
 import com.intellij.ide.highlighter.JavaFileType
+import com.intellij.openapi.progress.ProgressManager
 import com.intellij.openapi.project.Project
+import com.intellij.openapi.util.Key
 import com.intellij.openapi.vfs.VirtualFile
 import com.intellij.psi.JavaRecursiveElementVisitor
 import com.intellij.psi.PsiClass
@@ -11,7 +14,12 @@ import com.intellij.psi.PsiManager
 import com.intellij.psi.PsiMethod
 import com.intellij.psi.search.FileTypeIndex
 import com.intellij.psi.search.GlobalSearchScope
+import com.intellij.psi.util.CachedValue
+import com.intellij.psi.util.CachedValueProvider
+import com.intellij.psi.util.CachedValuesManager
+import com.intellij.psi.util.PsiModificationTracker
 import org.springforge.qualityassurance.model.FileFeatureModel
+import java.util.concurrent.ConcurrentHashMap
 
 /**
  * Extracts ML-model features from every Java source file in the project using
@@ -118,6 +126,129 @@ object PsiFeatureExtractor {
     /** MVC: package segments that signal the View layer */
     private val VIEW_PKG_MARKERS    = setOf("view", "views", "template", "templates", "thymeleaf", "freemarker")
 
+    private const val PKG_PORT    = 1
+    private const val PKG_ADAPTER = 2
+    private const val PKG_USECASE = 4
+    private const val PKG_GATEWAY = 8
+    private const val PKG_VIEW    = 16
+
+    /** Every package marker → its PKG_* flag */
+    private val PKG_MARKER_FLAGS: Map<String, Int> =
+        PORT_PKG_MARKERS.associateWith { PKG_PORT } +
+        ADAPTER_PKG_MARKERS.associateWith { PKG_ADAPTER } +
+        USECASE_PKG_MARKERS.associateWith { PKG_USECASE } +
+        GATEWAY_PKG_MARKERS.associateWith { PKG_GATEWAY } +
+        VIEW_PKG_MARKERS.associateWith { PKG_VIEW }
+
+    /**
+     * All package markers as one alternation inside a lookahead, so a single pass
+     * over the package name reports every marker it contains (overlaps included).
+     */
+    private val PKG_MARKER_REGEX = Regex(
+        "(?=(" + PKG_MARKER_FLAGS.keys.joinToString("|") { Regex.escape(it) } + "))"
+    )
+
+    /** PKG_* flags for every marker set with at least one entry contained in [pkg]. */
+    private fun scanPackageMarkers(pkg: String): Int {
+        var found = 0
+        for (match in PKG_MARKER_REGEX.findAll(pkg)) {
+            found = found or PKG_MARKER_FLAGS.getValue(match.groupValues[1])
+        }
+        return found
+    }
+
+    // ── Field dependency classification ───────────────────────────────────────
+
+    private const val DEP_NONE       = -1
+    private const val DEP_CONTROLLER = 0
+    private const val DEP_SERVICE    = 1
+    private const val DEP_REPOSITORY = 2
+    private const val DEP_ENTITY     = 3
+    private const val DEP_PORT       = 4
+    private const val DEP_ADAPTER    = 5
+    private const val DEP_USECASE    = 6
+    private const val DEP_GATEWAY    = 7
+
+    /** Field type text → DEP_* kind. Projects reuse a small set of field types. */
+    private val DEP_KIND_CACHE = ConcurrentHashMap<String, Int>()
+    private const val DEP_KIND_CACHE_LIMIT = 10_000
+
+    /**
+     * Cross-layer dependency kind of a field type (hexagonal / clean kinds included).
+     * Rules are checked in order and the first match wins, so e.g. "UserServicePort"
+     * counts as a service dependency.
+     */
+    private fun dependencyKind(typeText: String): Int {
+        DEP_KIND_CACHE[typeText]?.let { return it }
+
+        val ft = typeText.lowercase()
+        val kind = when {
+            ft.contains("controller")                         -> DEP_CONTROLLER
+            ft.contains("service")                           -> DEP_SERVICE
+            ft.contains("repository") || ft.contains("dao") -> DEP_REPOSITORY
+            ft.contains("entity") || ft.contains("model")   -> DEP_ENTITY
+            ft.contains("port")                              -> DEP_PORT
+            ft.contains("adapter")                           -> DEP_ADAPTER
+            // Hexagonal / Clean specific
+            ft.contains("usecase") || ft.contains("interactor")
+                    || ft.contains("inputport") || ft.contains("outputport") -> DEP_USECASE
+            ft.contains("gateway") || ft.contains("datasource")
+                    || ft.contains("persistence")                            -> DEP_GATEWAY
+            else -> DEP_NONE
+        }
+
+        if (DEP_KIND_CACHE.size >= DEP_KIND_CACHE_LIMIT) DEP_KIND_CACHE.clear()
+        DEP_KIND_CACHE[typeText] = kind
+        return kind
+    }
+
+    // ── Method-body signals ───────────────────────────────────────────────────
+
+    private const val BODY_LOGIC        = 1
+    private const val BODY_DATA_ACCESS  = 2
+    private const val BODY_NEW          = 4
+    private const val BODY_BROAD_CATCH  = 8
+    private const val BODY_ALL          = BODY_LOGIC or BODY_DATA_ACCESS or BODY_NEW or BODY_BROAD_CATCH
+
+    /**
+     * All method-body checks in one pattern, one capture group per signal:
+     *   1 → business logic (if / for / while / switch)
+     *   2 → data access (repository calls, entityManager, flush)
+     *   3 → `new` instantiation (" new ", "(new ", "= new ")
+     *   4 → broad catch (Exception / Throwable)
+     * Wrapped in a lookahead so matches are zero-width and may overlap,
+     * e.g. "if (new Foo()" reports both business logic and `new`.
+     */
+    private val BODY_SIGNAL_REGEX = Regex(
+        """(?=(?:((?:if|for|while|switch) ?\()""" +
+        """|(\.(?:save|saveAll|findById|findAll|deleteById|delete|existsById|count|flush)\(|entityManager)""" +
+        """|([ (]new )""" +
+        """|(catch ?\((?:Exception|Throwable))))"""
+    )
+
+    private fun scanBodySignals(body: String, seen: Int): Int {
+        var found = seen
+        for (match in BODY_SIGNAL_REGEX.findAll(body)) {
+            for (group in 1..4) {
+                if (match.groups[group] != null) found = found or (1 shl (group - 1))
+            }
+            if (found == BODY_ALL) break
+        }
+        return found
+    }
+
+    /**
+     * Line count of `text[start, end)`, equal to `substring(start, end).lines().size`
+     * for the '\n'-normalised PSI text, without building the substring or line list.
+     */
+    private fun countLines(text: CharSequence, start: Int, end: Int): Int {
+        var lines = 1
+        for (i in start until end) {
+            if (text[i] == '\n') lines++
+        }
+        return lines
+    }
+
     // ── Public API ────────────────────────────────────────────────────────────
 
     fun extractAllFiles(project: Project, architecture: String): List<FileFeatureModel> {
@@ -127,26 +258,77 @@ object PsiFeatureExtractor {
         )
         // Normalise architecture key to lowercase so comparisons are consistent
         val arch = architecture.lowercase()
-        return javaFiles.mapNotNull { vf -> extractFileFeatures(project, vf, arch) }
+
+        // Files are independent: extract them concurrently (JobLauncher keeps the
+        // caller's read action on its workers), then restore index order.
+        val files   = javaFiles.toList()
+        val results = arrayOfNulls<FileFeatureModel>(files.size)
+        JobLauncher.getInstance().invokeConcurrentlyUnderProgress(
+            files.indices.toList(),
+            ProgressManager.getInstance().progressIndicator
+        ) { i ->
+            results[i] = extractFileFeatures(project, files[i], arch)
+            true
+        }
+        return results.filterNotNull()
     }
 
     // ── Per-file extraction ───────────────────────────────────────────────────
 
+    /**
+     * Files above this size are generated or vendored sources, not hand-written layer
+     * classes; building their PSI dominates the scan and skews the per-file metrics.
+     */
+    private const val MAX_FILE_BYTES = 512_000L
+
+    /** Cached-value key per architecture, since the derived layer depends on it */
+    private val FEATURE_CACHE_KEYS = ConcurrentHashMap<String, Key<CachedValue<FileFeatureModel?>>>()
+
     private fun extractFileFeatures(
         project     : Project,
         virtualFile : VirtualFile,
         architecture: String       // already lowercase
     ): FileFeatureModel? {
 
+        if (virtualFile.length > MAX_FILE_BYTES) {
+            println("⚠️ Skipping oversized file (${virtualFile.length / 1024} KB): ${virtualFile.name}")
+            return null
+        }
+
         val psiFile = PsiManager.getInstance(project).findFile(virtualFile) as? PsiJavaFile
             ?: return null
 
+        // Re-running the analysis on an unchanged project reuses the features
+        // computed last time; any PSI change in the project drops them
+        val key = FEATURE_CACHE_KEYS.getOrPut(architecture) {
+            Key.create("springforge.qa.features.$architecture")
+        }
+        return CachedValuesManager.getCachedValue(psiFile, key) {
+            CachedValueProvider.Result.create(
+                computeFileFeatures(psiFile, virtualFile, architecture),
+                PsiModificationTracker.getInstance(project)
+            )
+        }
+    }
+
+    private fun computeFileFeatures(
+        psiFile     : PsiJavaFile,
+        virtualFile : VirtualFile,
+        architecture: String       // already lowercase
+    ): FileFeatureModel? {
+
+        // File text as a CharSequence view — method LOC is counted on it in place
+        val contents = psiFile.viewProvider.contents
+
+        // Import list is materialised once and shared by the count and Step 1
+        val importStatements = psiFile.importList?.importStatements ?: emptyArray()
+
         // ── Mutable counters / flags ──────────────────────────────────────────
         var loc         = 0
         var methods     = 0
         var classes     = 0
         var annotations = 0
-        var imports     = psiFile.importList?.importStatements?.size ?: 0
+        var imports     = importStatements.size
 
         var controllerDeps = 0
         var serviceDeps    = 0
@@ -156,6 +338,7 @@ object PsiFeatureExtractor {
         var portDeps       = 0
         var usecaseDeps    = 0   // ← was always 0 before v2
         var gatewayDeps    = 0   // ← was always 0 before v2
+        var totalCrossLayerDeps = 0   // running sum of the *Deps counters above
 
         var isController = false
         var isService    = false
@@ -182,20 +365,20 @@ object PsiFeatureExtractor {
         // Extra signals for anti-pattern detection
         var usesNewKeyword   = false   // tight_coupling_new_keyword
         var hasBroadCatch    = false   // broad_catch (catches Exception / Throwable)
+        var bodySignals      = 0       // BODY_* bits seen so far in method bodies
 
         // ── Step 1: scan imports ──────────────────────────────────────────────
-        val importStatements = psiFile.importList?.importStatements ?: emptyArray()
         for (imp in importStatements) {
             val fqn = imp.qualifiedName ?: continue
             when {
-                CONTROLLER_ANNOTATIONS.any { it == fqn } -> { isController = true; hasHttpHandling = true }
-                SERVICE_ANNOTATIONS.any    { it == fqn } -> isService    = true
-                REPOSITORY_ANNOTATIONS.any { it == fqn } -> isRepository = true
-                ENTITY_ANNOTATIONS.any     { it == fqn } -> isEntity     = true
-                ENTITY_FIELD_ANNOTATIONS.any { it == fqn } -> isEntity   = true
-                CONFIG_ANNOTATIONS.any     { it == fqn } -> isConfig     = true
-                TRANSACTION_ANNOTATIONS.any{ it == fqn } -> hasTransaction = true
-                VALIDATION_ANNOTATIONS.any { it == fqn } -> hasValidation  = true
+                fqn in CONTROLLER_ANNOTATIONS   -> { isController = true; hasHttpHandling = true }
+                fqn in SERVICE_ANNOTATIONS      -> isService    = true
+                fqn in REPOSITORY_ANNOTATIONS   -> isRepository = true
+                fqn in ENTITY_ANNOTATIONS       -> isEntity     = true
+                fqn in ENTITY_FIELD_ANNOTATIONS -> isEntity   = true
+                fqn in CONFIG_ANNOTATIONS       -> isConfig     = true
+                fqn in TRANSACTION_ANNOTATIONS  -> hasTransaction = true
+                fqn in VALIDATION_ANNOTATIONS   -> hasValidation  = true
                 fqn.startsWith("org.springframework.data.") -> isRepository = true
                 // Framework imports in domain layers (for framework_dependency_in_domain detection)
                 fqn.startsWith("org.springframework.") || fqn.startsWith("jakarta.") || fqn.startsWith("javax.") -> {
@@ -223,13 +406,13 @@ object PsiFeatureExtractor {
                     annotations++
                     val fqn = ann.qualifiedName ?: continue
                     when {
-                        CONTROLLER_ANNOTATIONS.any { it == fqn } -> { isController = true; hasHttpHandling = true }
-                        SERVICE_ANNOTATIONS.any    { it == fqn } -> { isService = true; hasBusinessLogic = true }
-                        REPOSITORY_ANNOTATIONS.any { it == fqn } -> isRepository = true
-                        ENTITY_ANNOTATIONS.any     { it == fqn } -> isEntity     = true
-                        CONFIG_ANNOTATIONS.any     { it == fqn } -> isConfig     = true
-                        COMPONENT_ANNOTATIONS.any  { it == fqn } -> isComponent  = true
-                        TRANSACTION_ANNOTATIONS.any{ it == fqn } -> hasTransaction = true
+                        fqn in CONTROLLER_ANNOTATIONS  -> { isController = true; hasHttpHandling = true }
+                        fqn in SERVICE_ANNOTATIONS     -> { isService = true; hasBusinessLogic = true }
+                        fqn in REPOSITORY_ANNOTATIONS  -> isRepository = true
+                        fqn in ENTITY_ANNOTATIONS      -> isEntity     = true
+                        fqn in CONFIG_ANNOTATIONS      -> isConfig     = true
+                        fqn in COMPONENT_ANNOTATIONS   -> isComponent  = true
+                        fqn in TRANSACTION_ANNOTATIONS -> hasTransaction = true
                     }
                 }
                 super.visitClass(aClass)
@@ -237,53 +420,33 @@ object PsiFeatureExtractor {
 
             override fun visitMethod(method: PsiMethod) {
                 methods++
-                loc += method.text.lines().size
+                val range = method.textRange
+                loc += countLines(contents, range.startOffset, range.endOffset)
 
                 for (ann in method.annotations) {
                     annotations++
                     val fqn = ann.qualifiedName ?: continue
                     when {
-                        CONTROLLER_ANNOTATIONS.any { it == fqn } -> { isController = true; hasHttpHandling = true }
-                        TRANSACTION_ANNOTATIONS.any{ it == fqn } -> hasTransaction = true
-                        VALIDATION_ANNOTATIONS.any { it == fqn } -> hasValidation  = true
-                        CONFIG_ANNOTATIONS.any     { it == fqn } -> isConfig       = true
+                        fqn in CONTROLLER_ANNOTATIONS  -> { isController = true; hasHttpHandling = true }
+                        fqn in TRANSACTION_ANNOTATIONS -> hasTransaction = true
+                        fqn in VALIDATION_ANNOTATIONS  -> hasValidation  = true
+                        fqn in CONFIG_ANNOTATIONS      -> isConfig       = true
                     }
                 }
 
                 for (param in method.parameterList.parameters) {
                     for (ann in param.annotations) {
-                        if (VALIDATION_ANNOTATIONS.any { it == ann.qualifiedName }) hasValidation = true
+                        if (ann.qualifiedName in VALIDATION_ANNOTATIONS) hasValidation = true
                     }
                 }
 
-                val body = method.body?.text ?: ""
-
-                // Business logic signals
-                if (body.contains("if (") || body.contains("if(")
-                    || body.contains("for (") || body.contains("for(")
-                    || body.contains("while (") || body.contains("while(")
-                    || body.contains("switch (") || body.contains("switch(")) {
-                    hasBusinessLogic = true
-                }
-
-                // Data access signals
-                if (body.contains(".save(") || body.contains(".saveAll(")
-                    || body.contains(".findById(") || body.contains(".findAll(")
-                    || body.contains(".deleteById(") || body.contains(".delete(")
-                    || body.contains(".existsById(") || body.contains(".count(")
-                    || body.contains("entityManager") || body.contains(".flush(")) {
-                    hasDataAccess = true
-                }
-
-                // tight_coupling_new_keyword: concrete instantiation via `new`
-                if (body.contains(" new ") || body.contains("(new ") || body.contains("= new ")) {
-                    usesNewKeyword = true
-                }
-
-                // broad_catch: catches Exception or Throwable directly
-                if (body.contains("catch (Exception")   || body.contains("catch(Exception")
-                    || body.contains("catch (Throwable") || body.contains("catch(Throwable")) {
-                    hasBroadCatch = true
+                // One regex pass per body; skipped once every body signal is known
+                if (bodySignals != BODY_ALL) {
+                    bodySignals = scanBodySignals(method.body?.text ?: "", bodySignals)
+                    if ((bodySignals and BODY_LOGIC) != 0)       hasBusinessLogic = true
+                    if ((bodySignals and BODY_DATA_ACCESS) != 0) hasDataAccess    = true
+                    if ((bodySignals and BODY_NEW) != 0)         usesNewKeyword   = true   // concrete instantiation via `new`
+                    if ((bodySignals and BODY_BROAD_CATCH) != 0) hasBroadCatch    = true   // catches Exception / Throwable
                 }
 
                 super.visitMethod(method)
@@ -292,26 +455,24 @@ object PsiFeatureExtractor {
             override fun visitField(field: PsiField) {
                 for (ann in field.annotations) {
                     val fqn = ann.qualifiedName ?: continue
-                    if (ENTITY_FIELD_ANNOTATIONS.any { it == fqn }) {
+                    if (fqn in ENTITY_FIELD_ANNOTATIONS) {
                         isEntity = true; annotations++
                     }
                 }
 
                 // Cross-layer dependency counting — now includes usecase & gateway
-                val ft = field.type.presentableText.lowercase()
-                when {
-                    ft.contains("controller")                         -> controllerDeps++
-                    ft.contains("service")                           -> serviceDeps++
-                    ft.contains("repository") || ft.contains("dao") -> repositoryDeps++
-                    ft.contains("entity") || ft.contains("model")   -> entityDeps++
-                    ft.contains("port")                              -> portDeps++
-                    ft.contains("adapter")                           -> adapterDeps++
-                    // Hexagonal / Clean specific
-                    ft.contains("usecase") || ft.contains("interactor")
-                            || ft.contains("inputport") || ft.contains("outputport") -> usecaseDeps++
-                    ft.contains("gateway") || ft.contains("datasource")
-                            || ft.contains("persistence")                            -> gatewayDeps++
+                val depKind = dependencyKind(field.type.presentableText)
+                when (depKind) {
+                    DEP_CONTROLLER -> controllerDeps++
+                    DEP_SERVICE    -> serviceDeps++
+                    DEP_REPOSITORY -> repositoryDeps++
+                    DEP_ENTITY     -> entityDeps++
+                    DEP_PORT       -> portDeps++
+                    DEP_ADAPTER    -> adapterDeps++
+                    DEP_USECASE    -> usecaseDeps++
+                    DEP_GATEWAY    -> gatewayDeps++
                 }
+                if (depKind != DEP_NONE) totalCrossLayerDeps++
 
                 super.visitField(field)
             }
@@ -319,38 +480,39 @@ object PsiFeatureExtractor {
 
         // ── Step 3: package / filename heuristics for hexagonal & clean arch ──
         val pkg  = psiFile.packageName.lowercase()
+        val pkgMarkers = scanPackageMarkers(pkg)
         val file = virtualFile.name.lowercase().removeSuffix(".java")
 
         // Port detection
-        if (PORT_PKG_MARKERS.any { pkg.contains(it) }
+        if ((pkgMarkers and PKG_PORT) != 0
             || file.endsWith("port") || file.endsWith("useport") || file.endsWith("inputport")
             || file.endsWith("outputport")) {
             isPort = true
         }
 
         // Adapter detection
-        if (ADAPTER_PKG_MARKERS.any { pkg.contains(it) }
+        if ((pkgMarkers and PKG_ADAPTER) != 0
             || file.endsWith("adapter") || file.endsWith("adapterimpl")) {
             isAdapter = true
         }
 
         // UseCase detection
-        if (USECASE_PKG_MARKERS.any { pkg.contains(it) }
+        if ((pkgMarkers and PKG_USECASE) != 0
             || file.endsWith("usecase") || file.endsWith("usecaseimpl")
             || file.endsWith("interactor") || file.endsWith("service") && (
-                USECASE_PKG_MARKERS.any { pkg.contains(it) })) {
+                (pkgMarkers and PKG_USECASE) != 0)) {
             isUseCase = true
         }
 
         // Gateway detection
-        if (GATEWAY_PKG_MARKERS.any { pkg.contains(it) }
+        if ((pkgMarkers and PKG_GATEWAY) != 0
             || file.endsWith("gateway") || file.endsWith("gatewayimpl")
             || file.endsWith("datasource") || file.endsWith("datasourceimpl")) {
             isGateway = true
         }
 
         // MVC View detection
-        if (VIEW_PKG_MARKERS.any { pkg.contains(it) }
+        if ((pkgMarkers and PKG_VIEW) != 0
             || file.endsWith("view") || file.endsWith("viewmodel")
             || file.endsWith("form") || file.endsWith("template")) {
             isView = true
@@ -389,7 +551,7 @@ object PsiFeatureExtractor {
             hasDataAccess   = hasDataAccess,
             hasBusinessLogic= hasBusinessLogic,
             repositoryDeps  = repositoryDeps,
-            packageName     = pkg,
+            pkgMarkers      = pkgMarkers,
             fileName        = file
         )
 
@@ -425,9 +587,7 @@ object PsiFeatureExtractor {
             port_deps               = portDeps,
             usecase_deps            = usecaseDeps,
             gateway_deps            = gatewayDeps,
-            total_cross_layer_deps  = controllerDeps + serviceDeps + repositoryDeps
-                                      + entityDeps + adapterDeps + portDeps
-                                      + usecaseDeps + gatewayDeps,
+            total_cross_layer_deps  = totalCrossLayerDeps,
             has_business_logic      = hasBusinessLogic,
             has_data_access         = hasDataAccess,
             has_http_handling       = hasHttpHandling,
@@ -529,10 +689,9 @@ object PsiFeatureExtractor {
         hasDataAccess   : Boolean,
         hasBusinessLogic: Boolean,
         repositoryDeps  : Int,
-        packageName     : String,
+        pkgMarkers      : Int,
         fileName        : String
     ): String {
-        val pkg  = packageName
         val file = fileName
 
         return when (architecture) {
@@ -541,26 +700,26 @@ object PsiFeatureExtractor {
                 isController, isService, isRepository, isEntity, isConfig,
                 isPort, isAdapter, isUseCase, isGateway,
                 hasHttpHandling, hasDataAccess, hasBusinessLogic,
-                repositoryDeps, pkg, file
+                repositoryDeps, pkgMarkers, file
             )
 
             "clean_architecture" -> detectCleanLayer(
                 isController, isService, isRepository, isEntity, isConfig,
                 isPort, isAdapter, isUseCase, isGateway,
                 hasHttpHandling, hasDataAccess, hasBusinessLogic,
-                repositoryDeps, pkg, file
+                repositoryDeps, pkgMarkers, file
             )
 
             "mvc" -> detectMvcLayer(
                 isController, isService, isRepository, isEntity, isConfig,
                 isView, hasHttpHandling, hasDataAccess, hasBusinessLogic,
-                repositoryDeps, pkg, file
+                repositoryDeps, pkgMarkers, file
             )
 
             else -> detectLayeredLayer(
                 isController, isService, isRepository, isEntity, isConfig,
                 isComponent, hasHttpHandling, hasDataAccess, hasBusinessLogic,
-                repositoryDeps, pkg, file
+                repositoryDeps, pkgMarkers, file
             )
         }
     }
@@ -571,7 +730,7 @@ object PsiFeatureExtractor {
         isController: Boolean, isService: Boolean, isRepository: Boolean,
         isEntity: Boolean, isConfig: Boolean, isComponent: Boolean,
         hasHttpHandling: Boolean, hasDataAccess: Boolean, hasBusinessLogic: Boolean,
-        repositoryDeps: Int, pkg: String, file: String
+        repositoryDeps: Int, pkgMarkers: Int, file: String
     ): String {
         // 1. Annotation-based (highest confidence)
         if (isController || hasHttpHandling) return "controller"
@@ -604,7 +763,7 @@ object PsiFeatureExtractor {
         isController: Boolean, isService: Boolean, isRepository: Boolean,
         isEntity: Boolean, isConfig: Boolean, isView: Boolean,
         hasHttpHandling: Boolean, hasDataAccess: Boolean, hasBusinessLogic: Boolean,
-        repositoryDeps: Int, pkg: String, file: String
+        repositoryDeps: Int, pkgMarkers: Int, file: String
     ): String {
         if (isController || hasHttpHandling) return "controller"
         if (isView)                          return "view"
@@ -613,7 +772,7 @@ object PsiFeatureExtractor {
         if (isService)                       return "service"
         if (isConfig)                        return "config"
 
-        if (VIEW_PKG_MARKERS.any { pkg.contains(it) }) return "view"
+        if ((pkgMarkers and PKG_VIEW) != 0) return "view"
 
         if (file.endsWith("controller"))                               return "controller"
         if (file.endsWith("service") || file.endsWith("serviceimpl")) return "service"
@@ -636,7 +795,7 @@ object PsiFeatureExtractor {
         isEntity: Boolean, isConfig: Boolean,
         isPort: Boolean, isAdapter: Boolean, isUseCase: Boolean, isGateway: Boolean,
         hasHttpHandling: Boolean, hasDataAccess: Boolean, hasBusinessLogic: Boolean,
-        repositoryDeps: Int, pkg: String, file: String
+        repositoryDeps: Int, pkgMarkers: Int, file: String
     ): String {
         // Annotation-based gives us controller/service/entity/repository signals
         // but in hexagonal arch those map to adapter/usecase/entity/gateway
@@ -648,10 +807,10 @@ object PsiFeatureExtractor {
         if (isConfig)                        return "config"
 
         // Package heuristics
-        if (PORT_PKG_MARKERS.any    { pkg.contains(it) }) return "port"
-        if (ADAPTER_PKG_MARKERS.any { pkg.contains(it) }) return "adapter"
-        if (USECASE_PKG_MARKERS.any { pkg.contains(it) }) return "usecase"
-        if (GATEWAY_PKG_MARKERS.any { pkg.contains(it) }) return "gateway"
+        if ((pkgMarkers and PKG_PORT) != 0) return "port"
+        if ((pkgMarkers and PKG_ADAPTER) != 0) return "adapter"
+        if ((pkgMarkers and PKG_USECASE) != 0) return "usecase"
+        if ((pkgMarkers and PKG_GATEWAY) != 0) return "gateway"
 
         // Filename heuristics
         if (file.endsWith("port") || file.endsWith("inputport")
@@ -674,7 +833,7 @@ object PsiFeatureExtractor {
         isEntity: Boolean, isConfig: Boolean,
         isPort: Boolean, isAdapter: Boolean, isUseCase: Boolean, isGateway: Boolean,
         hasHttpHandling: Boolean, hasDataAccess: Boolean, hasBusinessLogic: Boolean,
-        repositoryDeps: Int, pkg: String, file: String
+        repositoryDeps: Int, pkgMarkers: Int, file: String
     ): String {
         // Clean Architecture rings: Entity (innermost) → UseCase → Gateway/Port → Adapter (outermost)
         if (isEntity)                          return "entity"
@@ -685,10 +844,10 @@ object PsiFeatureExtractor {
         if (isConfig)                          return "config"
 
         // Package heuristics
-        if (GATEWAY_PKG_MARKERS.any { pkg.contains(it) }) return "gateway"
-        if (USECASE_PKG_MARKERS.any { pkg.contains(it) }) return "usecase"
-        if (PORT_PKG_MARKERS.any    { pkg.contains(it) }) return "port"
-        if (ADAPTER_PKG_MARKERS.any { pkg.contains(it) }) return "adapter"
+        if ((pkgMarkers and PKG_GATEWAY) != 0) return "gateway"
+        if ((pkgMarkers and PKG_USECASE) != 0) return "usecase"
+        if ((pkgMarkers and PKG_PORT) != 0) return "port"
+        if ((pkgMarkers and PKG_ADAPTER) != 0) return "adapter"
 
         // Filename heuristics
         if (file.endsWith("usecase") || file.endsWith("usecaseimpl")
@@ -3,7 +3,9 @@ package org.springforge.qualityassurance.network
 import okhttp3.MediaType.Companion.toMediaType
 import okhttp3.OkHttpClient
 import okhttp3.Request
+import okhttp3.RequestBody
 import okhttp3.RequestBody.Companion.toRequestBody
+import okio.Buffer
 import org.springforge.qualityassurance.model.*
 import org.springforge.qualityassurance.network.MLServiceClient.analyzeProjectFull
 import org.springforge.qualityassurance.network.MLServiceClient.normaliseArchitecture
@@ -25,6 +27,7 @@ import java.util.concurrent.TimeUnit
 object MLServiceClient {
 
     private const val BASE_URL = "https://api.springforge.dev/quality/"
+    private val JSON_MEDIA_TYPE = "application/json".toMediaType()
 
     private val client = OkHttpClient.Builder()
         .connectTimeout(30, TimeUnit.SECONDS)
@@ -37,10 +40,9 @@ object MLServiceClient {
     // =========================================================================
 
     fun analyzeProjectFull(files: List<FileFeatureModel>): CombinedAnalysisResult {
-        val normalised = files.map { it.copy(architecture_pattern = normaliseArchitecture(it.architecture_pattern)) }
-        val json = JsonUtil.toJson(ProjectAnalysisRequest(files = normalised))
+        val normalised = normaliseFiles(files)
         println("🔥 Sending ${normalised.size} files to /analyze-project-full (arch: ${normalised.firstOrNull()?.architecture_pattern ?: "?"})…")
-        val responseText = post("/analyze-project-full", json)
+        val responseText = post("/analyze-project-full", ProjectAnalysisRequest(files = normalised))
         println("🟩 Combined analysis complete.")
         return JsonUtil.fromJson(responseText, CombinedAnalysisResult::class.java)
     }
@@ -50,10 +52,9 @@ object MLServiceClient {
     // =========================================================================
 
     fun analyzeProject(files: List<FileFeatureModel>): EnhancedPredictionResult {
-        val normalised = files.map { it.copy(architecture_pattern = normaliseArchitecture(it.architecture_pattern)) }
-        val json = JsonUtil.toJson(ProjectAnalysisRequest(files = normalised))
+        val normalised = normaliseFiles(files)
         println("🔥 Analyzing ${normalised.size} files…")
-        val responseText = post("/analyze-project", json)
+        val responseText = post("/analyze-project", ProjectAnalysisRequest(files = normalised))
         return JsonUtil.fromJson(responseText, EnhancedPredictionResult::class.java)
     }
 
@@ -76,9 +77,8 @@ object MLServiceClient {
             architecture_pattern = normaliseArchitecture(analysisResult.architecture_pattern),
             file_sources         = fileSources
         )
-        val json = JsonUtil.toJson(request)
         println("🤖 Calling Gemini for ${analysisResult.anti_patterns.size} fix suggestions…")
-        val responseText = post("/generate-fixes", json)
+        val responseText = post("/generate-fixes", request)
         println("🟩 Gemini fix suggestions received.")
         return JsonUtil.fromJson(responseText, ProjectFixResult::class.java)
     }
@@ -103,9 +103,8 @@ object MLServiceClient {
             severity             = severity,
             description          = description
         )
-        val json = JsonUtil.toJson(request)
         println("🤖 Calling Gemini for single fix: $antiPatternType…")
-        val responseText = post("/generate-fix", json)
+        val responseText = post("/generate-fix", request)
         return JsonUtil.fromJson(responseText, FixSuggestion::class.java)
     }
 
@@ -141,12 +140,41 @@ object MLServiceClient {
         }
     }
 
+    /**
+     * [files] with every architecture_pattern normalised. Each distinct raw value is
+     * normalised once, and a batch that already carries the service keys (the usual
+     * case — PsiFeatureExtractor tags every file with the same key) is sent as-is
+     * instead of being copied file by file.
+     */
+    private fun normaliseFiles(files: List<FileFeatureModel>): List<FileFeatureModel> {
+        val normalisedByRaw = HashMap<String, String>()
+        fun normalised(raw: String) = normalisedByRaw.getOrPut(raw) { normaliseArchitecture(raw) }
+
+        if (files.all { normalised(it.architecture_pattern) == it.architecture_pattern }) return files
+        return files.map {
+            val arch = normalised(it.architecture_pattern)
+            if (arch == it.architecture_pattern) it else it.copy(architecture_pattern = arch)
+        }
+    }
+
     // =========================================================================
     //  Private HTTP helper
     // =========================================================================
 
-    private fun post(path: String, json: String): String {
-        val body    = json.toRequestBody("application/json".toMediaType())
+    /**
+     * Request body holding [payload] serialised straight to UTF-8 bytes. Project
+     * payloads carry every file's source code, so this skips the intermediate JSON
+     * String. The body is sized, so requests keep sending Content-Length rather than
+     * switching to chunked transfer encoding behind the API gateway.
+     */
+    private fun jsonBody(payload: Any): RequestBody {
+        val buffer = Buffer()
+        buffer.outputStream().bufferedWriter(Charsets.UTF_8).use { JsonUtil.writeJson(payload, it) }
+        return buffer.readByteString().toRequestBody(JSON_MEDIA_TYPE)
+    }
+
+    private fun post(path: String, payload: Any): String {
+        val body    = jsonBody(payload)
         val request = Request.Builder().url("$BASE_URL$path").post(body).build()
         val response = client.newCall(request).execute()
         if (!response.isSuccessful) {
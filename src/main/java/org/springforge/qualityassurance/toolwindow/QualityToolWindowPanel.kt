@@ -197,15 +197,18 @@ class QualityToolWindowPanel : JPanel() {
                 sb.ln("└${"─".repeat(26)}┴${"─".repeat(7)}┴${"─".repeat(30)}┘")
             }
 
-            val issueGroups = ls.files.flatMap { it.issues }.groupBy { it }
-            if (issueGroups.isNotEmpty()) {
+            // issue → number of files, most frequent first
+            val issueCounts = ls.files.asSequence().flatMap { it.issues.asSequence() }
+                .groupingBy { it }.eachCount()
+                .entries.sortedByDescending { it.value }
+            if (issueCounts.isNotEmpty()) {
                 sb.ln()
                 sb.ln("Primary Issues:")
-                issueGroups.entries.sortedByDescending { it.value.size }.take(4)
-                    .forEach { sb.ln("  • ${it.key} (${it.value.size} file${if (it.value.size > 1) "s" else ""})") }
+                issueCounts.take(4)
+                    .forEach { sb.ln("  • ${it.key} (${it.value} file${if (it.value > 1) "s" else ""})") }
                 sb.ln()
                 sb.ln("Recommendations:")
-                issueGroups.entries.sortedByDescending { it.value.size }.take(3)
+                issueCounts.take(3)
                     .forEachIndexed { i, e -> sb.ln("  ${i + 1}. ${getRecommendation(e.key)}") }
             }
             sb.ln()
@@ -7,5 +7,8 @@ object JsonUtil {
 
     fun toJson(obj: Any): String = gson.toJson(obj)
 
+    /** Serialise [obj] straight into [writer] without building the whole JSON string. */
+    fun writeJson(obj: Any, writer: Appendable) = gson.toJson(obj, writer)
+
     fun <T> fromJson(json: String, clazz: Class<T>): T = gson.fromJson(json, clazz)
 }
@@ -6,6 +6,13 @@ import java.io.File
 
 object ProjectEnvExtractor {
 
+    private val BUILD_FILE_NAMES = setOf("pom.xml", "build.gradle", "build.gradle.kts")
+
+    /** Build output, dependency and tooling folders — they never hold a project's own build file */
+    private val SKIPPED_DIRS = setOf(
+        "node_modules", "target", "build", "out", "bin", "dist", "venv", "__pycache__"
+    )
+
     fun extractEnvironment(project: Project): Map<String, String> {
         // 1. Grab the JDK Version
         val jdkVersion = ProjectRootManager.getInstance(project).projectSdk?.versionString ?: "Unknown JDK"
@@ -86,9 +93,11 @@ object ProjectEnvExtractor {
         if (depth > 3) return // Limit search depth
         try {
             dir.listFiles()?.forEach { file ->
-                if (file.isFile && (file.name == "pom.xml" || file.name == "build.gradle" || file.name == "build.gradle.kts")) {
+                val name = file.name
+                // Name checks first so most entries never need a stat call
+                if (name in BUILD_FILE_NAMES && file.isFile) {
                     onFound(file)
-                } else if (file.isDirectory && !file.name.startsWith(".")) {
+                } else if (!name.startsWith(".") && name !in SKIPPED_DIRS && file.isDirectory) {
                     searchBuildFilesRecursively(file, onFound, depth + 1)
                 }
             }
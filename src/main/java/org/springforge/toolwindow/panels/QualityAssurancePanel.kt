@@ -1039,8 +1039,9 @@ class QualityReportDialog(
         root.add(vgap(20))
 
         root.add(sectionLabel("VIOLATIONS BY SEVERITY")); root.add(vgap(10))
+        val sevCounts = result.anti_patterns.groupingBy { it.severity }.eachCount()
         val sevRows = listOf("CRITICAL","HIGH","MEDIUM","LOW").mapNotNull { sev ->
-            val c = result.anti_patterns.count { it.severity == sev }
+            val c = sevCounts[sev] ?: 0
             if (c > 0) "$sev" to "$c violation${if(c>1)"s" else ""}" else null
         }
         if (sevRows.isEmpty()) {
@@ -121,17 +121,8 @@ class RuntimeAnalysisPanel(private val project: Project) : JPanel() {
         }
 
         // Runtime exception / stack trace patterns
-        val hasExceptionLine = Regex(
-            """([A-Za-z_${'$'}][A-Za-z0-9_${'$'}]*\.)*[A-Za-z_${'$'}][A-Za-z0-9_${'$'}]*Exception[:\s]|""" +
-            """([A-Za-z_${'$'}][A-Za-z0-9_${'$'}]*\.)*[A-Za-z_${'$'}][A-Za-z0-9_${'$'}]*Error[:\s]|""" +
-            """Caused by:|""" +
-            """Exception in thread"""
-        ).containsMatchIn(text)
-
-        val hasStackFrame = Regex(
-            """^\s*at\s+[\w${'$'}]+[\w${'$'}.]+\([\w${'$'}]+\.(?:java|kt):\d+\)""",
-            RegexOption.MULTILINE
-        ).containsMatchIn(text)
+        val hasExceptionLine = EXCEPTION_LINE_REGEX.containsMatchIn(text)
+        val hasStackFrame = STACK_FRAME_REGEX.containsMatchIn(text)
 
         val isSpringBootFailureBanner = text.contains("APPLICATION FAILED TO START") ||
                 (text.contains("Description:") && text.contains("Action:"))
@@ -141,13 +132,11 @@ class RuntimeAnalysisPanel(private val project: Project) : JPanel() {
             isSpringBootFailureBanner -> null // valid
 
             // 2. Looks like plain code
-            Regex("""^\s*(public|private|protected|class|fun|import|package)\s""", RegexOption.MULTILINE)
-                    .containsMatchIn(text) && !hasExceptionLine && !hasStackFrame ->
+            SOURCE_CODE_REGEX.containsMatchIn(text) && !hasExceptionLine && !hasStackFrame ->
                 "This looks like source code, not an error log. Please paste the exception stacktrace from your console or logs"
 
             // 3. Looks like plain English / prose
-            !hasExceptionLine && !hasStackFrame && Regex("""^[A-Z][a-z].*[.?!]$""", RegexOption.MULTILINE)
-                    .containsMatchIn(text) ->
+            !hasExceptionLine && !hasStackFrame && PROSE_REGEX.containsMatchIn(text) ->
                 "This looks like plain text, not an error log. Please paste the exception stacktrace from your console or logs"
 
             // 4. Has some exception-like word but no stack frames — maybe partial paste
@@ -688,4 +677,34 @@ class RuntimeAnalysisPanel(private val project: Project) : JPanel() {
 //        }
 //        return refs
 //    }
+
+    companion object {
+        // ── Stacktrace validation patterns ──
+        // Pasted logs can be huge, so every pattern runs in linear time: no nested or
+        // overlapping quantifiers, and possessive (*+, ++) where backtracking is useless.
+
+        /**
+         * "FooException:" / "com.x.FooError " / "Caused by:" / "Exception in thread".
+         * Same matches as the former `([A-Za-z_$][A-Za-z0-9_$]*\.)*[A-Za-z_$][A-Za-z0-9_$]*Exception[:\s]`:
+         * the optional qualifier never changes whether a substring matches, and a run of
+         * identifier chars ending in "Exception" contains a letter exactly when the nearest
+         * letter before "Exception" is followed by digits only.
+         */
+        private val EXCEPTION_LINE_REGEX = Regex(
+            """[A-Za-z_${'$'}][0-9]*+(?:Exception|Error)[:\s]|Caused by:|Exception in thread"""
+        )
+
+        /** "at com.example.Foo.bar(Foo.java:42)" */
+        private val STACK_FRAME_REGEX = Regex(
+            """^\s*+at\s++[\w${'$'}][\w${'$'}.]++\([\w${'$'}]++\.(?:java|kt):\d++\)""",
+            RegexOption.MULTILINE
+        )
+
+        private val SOURCE_CODE_REGEX = Regex(
+            """^\s*+(public|private|protected|class|fun|import|package)\s""",
+            RegexOption.MULTILINE
+        )
+
+        private val PROSE_REGEX = Regex("""^[A-Z][a-z].*[.?!]$""", RegexOption.MULTILINE)
+    }
 }
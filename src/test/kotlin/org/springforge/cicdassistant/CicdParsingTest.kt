@@ -0,0 +1,78 @@
+package org.springforge.cicdassistant
+
+import org.junit.jupiter.api.Assertions.*
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.io.TempDir
+import org.springforge.cicdassistant.github.GitHubMCPClient
+import org.springforge.cicdassistant.parsers.GradleBuildAnalyzer
+import java.io.File
+
+class CicdParsingTest {
+
+    // ── Test 1: class-level @RequestMapping does not hide the first handler ──
+
+    @Test
+    fun `parseRestEndpoints keeps handlers after class level RequestMapping`() {
+        val controller = """
+            @RestController
+            @RequestMapping("/api/users")
+            public class UserController {
+
+                @GetMapping("/all")
+                public String all() {
+                    return "all";
+                }
+
+                @PostMapping("/add")
+                public String add(@RequestBody String user) {
+                    return user;
+                }
+            }
+        """.trimIndent()
+
+        val endpoints = GitHubMCPClient.parseRestEndpoints(controller, "UserController")
+            .map { "${it.httpMethod} ${it.path} ${it.method}" }
+
+        assertEquals(listOf("GET /all all", "POST /add add", "ANY /api/users all"), endpoints)
+    }
+
+    // ── Test 2: dependencies after a nested exclude block are still found ────
+
+    @Test
+    fun `GradleBuildAnalyzer keeps dependencies after nested exclude block`(@TempDir dir: File) {
+        File(dir, "build.gradle.kts").writeText("""
+            plugins {
+                id("org.springframework.boot") version "3.2.0"
+            }
+
+            dependencies {
+                implementation("org.springframework.boot:spring-boot-starter-web:3.2.0") {
+                    exclude(group = "org.springframework.boot", module = "spring-boot-starter-tomcat")
+                }
+                implementation("org.springframework.boot:spring-boot-starter-data-jpa:3.2.0")
+            }
+        """.trimIndent())
+
+        val metadata = GradleBuildAnalyzer().analyze(dir)
+
+        assertEquals(
+            listOf("spring-boot-starter-web", "spring-boot-starter-data-jpa"),
+            metadata.dependencies.map { it.artifact }
+        )
+        assertTrue(metadata.hasSpringBootStarterData())
+    }
+
+    // ── Test 3: an unclosed block yields no body ─────────────────────────────
+
+    @Test
+    fun `GradleBuildAnalyzer blockBody returns null for unclosed block`() {
+        val content = """
+            dependencies {
+                implementation("org.example:lib:1.0") {
+                    exclude(group = "org.example")
+                }
+        """.trimIndent()
+
+        assertNull(GradleBuildAnalyzer.blockBody(content, Regex("""dependencies\s*\{""")))
+    }
+}